@@ -0,0 +1,183 @@
+"""
+Benchmark suite for the pipeline, routing and graph hot paths on synthetic data.
+
+    python benchmarks/run_benchmarks.py --sizes 10k --out bench.json
+    python benchmarks/run_benchmarks.py --sizes 10k,1M --compare bench.json
+
+Each benchmark is timed without tracing (fastest of --repeat runs), then re-run
+under tracemalloc for peak memory (skip with --no-memory). Results are written
+as JSON; --compare prints the time ratio against a previous run and exits
+non-zero on regressions.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import synthetic  # noqa: E402
+from ships.cleaning import clean_places_df  # noqa: E402
+from ships.extractor import extract_details  # noqa: E402
+from ships.joins import make_joined_table  # noqa: E402
+from ships.pipeline import PIPELINE_STAGES  # noqa: E402
+from ships.routes import build_routes_graph  # noqa: E402
+
+# (name, setup(n, seed) -> (args, rows)), the timed call is fn(*args)
+Benchmark = Tuple[str, Callable, Callable]
+
+
+# inputs of each pipeline stage for the current (size, seed), built by chaining the
+# stages once; the expansion stage is far too slow to recompute in every setup
+_stage_inputs = {"key": None, "frames": []}
+
+
+def _stage_input(n, seed, upto):
+    if _stage_inputs["key"] != (n, seed):
+        _stage_inputs.update(key=(n, seed), frames=[synthetic.make_crew_table(n, seed)])
+    frames = _stage_inputs["frames"]
+    while len(frames) <= upto:
+        _, prev = PIPELINE_STAGES[len(frames) - 1]
+        frames.append(prev(frames[-1].copy()))
+    return frames[upto]
+
+
+def _pipeline_benchmarks() -> List[Benchmark]:
+    """One benchmark per run_pipeline stage, each fed with the previous stage's output."""
+    out = []
+    for i, (name, stage) in enumerate(PIPELINE_STAGES):
+        def setup(n, seed, _upto=i):
+            df = _stage_input(n, seed, _upto).copy()  # stages mutate their input frame
+            return (df,), len(df)
+        out.append((f"pipeline.{name}", setup, stage))
+    return out
+
+
+def _assemble_setup(n, seed):
+    from ships import sea_routes
+    sea_routes.marnet_geograph = synthetic.StandInGeograph()
+    stops = synthetic.make_stop_sequences(max(1, n // 100), seed)
+    return (stops, synthetic.latlon_map()), len(stops)
+
+
+def _assemble_all(stops, pl_map):
+    from ships.sea_routes import assemble_full_path_from_stops
+    for s in stops:
+        assemble_full_path_from_stops(s, pl_map)
+
+
+def _joined_setup(n, seed):
+    record = synthetic.make_crew_table(n, seed)
+    voyage = synthetic.make_voyage_table(max(1, n // 100), seed)
+    return ([record, voyage],), n
+
+
+BENCHMARKS: List[Benchmark] = [
+    ("extract_details",
+     lambda n, seed: ((synthetic.make_remarks(n, seed),), n),
+     lambda remarks: remarks.map(extract_details)),
+    *_pipeline_benchmarks(),
+    ("build_routes_graph",
+     lambda n, seed: ((synthetic.make_legs(n, seed),), n),
+     build_routes_graph),
+    ("clean_places_df",
+     lambda n, seed: ((synthetic.make_crew_table(n, seed)[["place"]],), n),
+     clean_places_df),
+    ("make_joined_table", _joined_setup, make_joined_table),
+    ("assemble_full_path_from_stops", _assemble_setup, _assemble_all),
+]
+
+
+# timings below this are dominated by noise and are not flagged by --compare
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def run_one(name: str, setup: Callable, fn: Callable, n: int, seed: int,
+            memory: bool, repeat: int = 1) -> Dict:
+    seconds = float("inf")
+    for _ in range(repeat):
+        args, rows = setup(n, seed)  # fresh inputs: several stages mutate their frame
+        start = time.perf_counter()
+        fn(*args)
+        seconds = min(seconds, time.perf_counter() - start)
+    result = {"name": name, "size": n, "rows": rows, "seconds": round(seconds, 6),
+              "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None}
+    if memory:
+        args, _ = setup(n, seed)
+        tracemalloc.start()
+        try:
+            fn(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_mb"] = round(peak / 2**20, 3)
+    return result
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> bool:
+    """Print time ratios against baseline; return True if any benchmark regressed."""
+    base = {(r["name"], r["size"]): r for r in baseline["results"]}
+    regressed = False
+    print(f"{'benchmark':<36}{'size':>10}{'base s':>12}{'now s':>12}{'ratio':>8}")
+    for r in current["results"]:
+        b = base.get((r["name"], r["size"]))
+        if b is None or not b["seconds"]:
+            continue
+        ratio = r["seconds"] / b["seconds"]
+        noisy = max(r["seconds"], b["seconds"]) < MIN_COMPARABLE_SECONDS
+        flag = "  REGRESSION" if ratio > threshold and not noisy else ""
+        regressed = regressed or bool(flag)
+        print(f"{r['name']:<36}{r['size']:>10}{b['seconds']:>12.4f}{r['seconds']:>12.4f}{ratio:>8.2f}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ships hot paths on synthetic data")
+    parser.add_argument("--sizes", default="10k", help="Comma-separated row counts, e.g. 10k,1M,10M")
+    parser.add_argument("--only", default=None, help="Comma-separated benchmark names (prefix match)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per benchmark; the fastest is kept")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory pass")
+    parser.add_argument("--out", default=None, help="Write JSON results here (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Previous JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Time ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [synthetic.parse_size(s) for s in args.sizes.split(",")]
+    only = [o.strip() for o in args.only.split(",")] if args.only else None
+    selected = [b for b in BENCHMARKS if not only or any(b[0].startswith(o) for o in only)]
+
+    results = []
+    for n in sizes:
+        for name, setup, fn in selected:
+            r = run_one(name, setup, fn, n, args.seed, memory=not args.no_memory, repeat=args.repeat)
+            print(f"{name:<36}{n:>10}{r['seconds']:>12.4f}s", file=sys.stderr)
+            results.append(r)
+
+    report = {
+        "meta": {"python": platform.python_version(), "pandas": pd.__version__,
+                 "platform": platform.platform(), "seed": args.seed},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text)
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Seeded generators for synthetic crew / person / voyage tables.
+Remarks follow the shapes found in the crew registers (embarqué / débarqué /
+déserté / mort / rembarqué ... with dd/mm/yyyy dates) so the extractor and the
+pipeline exercise the same regex branches as on real data.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# place -> (lat, lon); also used as the lat/lon map for route assembly
+PLACES: Dict[str, Tuple[float, float]] = {
+    "Lorient": (47.75, -3.37),
+    "Port-Louis": (47.71, -3.36),
+    "Brest": (48.39, -4.49),
+    "Rochefort": (45.94, -0.96),
+    "Saint-Malo": (48.65, -2.01),
+    "Nantes": (47.22, -1.55),
+    "Cadix": (36.53, -6.29),
+    "Le Cap": (-33.92, 18.42),
+    "Île de France": (-20.16, 57.50),
+    "Bourbon": (-20.88, 55.45),
+    "Pondichéry": (11.93, 79.83),
+    "Chandernagor": (22.87, 88.37),
+    "Mahé": (11.70, 75.54),
+    "Canton": (23.13, 113.26),
+}
+PLACE_NAMES = list(PLACES)
+SHIP_NAMES = ["la Sirène", "le Duc de Bourgogne", "la Paix", "le Dauphin", "l'Hercule", "la Baleine"]
+LAST_NAMES = ["Le Gall", "Martin", "Bernard", "Guillou", "Le Roux", "Moreau", "Tanguy", "Daniel", "Jaouen", "Kerhervé"]
+FIRST_NAMES = ["Jean", "Pierre", "Yves", "Louis", "François", "Joseph", "Guillaume", "René", "Julien", "Marie"]
+FUNCTIONS = ["matelot", "mousse", "novice", "charpentier", "calfat", "canonnier", "soldat", "passager"]
+
+EMBARK_TEMPLATES = [
+    "embarqué à {p1} le {d1}",
+    "embarquée à {p1} le {d1}",
+    "rembarqué à {p1} le {d1}",
+    "supplément à {p1} du {d1}",
+    "remplacement à {p1} le {d1}",
+    "trouvé caché à bord après le départ de {p1} le {d1}",
+    "a fait la campagne de l'Inde à {p1}",
+]
+DISEMBARK_TEMPLATES = [
+    "débarqué à {p2} le {d2}",
+    "débarqué au désarmement à {p2} le {d2}",
+    "débarqué malade à l'hôpital de {p2} le {d2}",
+    "déserté à {p2} le {d2}",
+    "mort en mer le {d2}",
+    "mort à l'hôpital de {p2} le {d2}",
+    "mort à bord le {d2}",
+    "passé sur la {ship} en rade de {p2} le {d2}",
+    "resté malade à l'hôpital de {p2} le {d2}",
+]
+# share of rows whose remark contains a second leg after a rembarqué
+REEMBARK_RATE = 0.1
+
+
+def parse_size(size: str) -> int:
+    """'10k' -> 10_000, '1M' -> 1_000_000, '500' -> 500."""
+    s = str(size).strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(s[-1:], 1)
+    return int(float(s[:-1] if scale > 1 else s) * scale)
+
+
+def _dates(rng: np.random.Generator, n: int, start_year: int = 1720, years: int = 70) -> np.ndarray:
+    base = np.datetime64(f"{start_year}-01-01")
+    return base + rng.integers(0, years * 365, size=n).astype("timedelta64[D]")
+
+
+def _fmt(dates: np.ndarray) -> List[str]:
+    return pd.DatetimeIndex(dates).strftime("%d/%m/%Y").tolist()
+
+
+def make_remarks(n: int, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    emb = rng.integers(0, len(EMBARK_TEMPLATES), size=n)
+    dis = rng.integers(0, len(DISEMBARK_TEMPLATES), size=n)
+    p1 = rng.integers(0, len(PLACE_NAMES), size=n)
+    p2 = rng.integers(0, len(PLACE_NAMES), size=n)
+    ships = rng.integers(0, len(SHIP_NAMES), size=n)
+    start = _dates(rng, n)
+    d1 = _fmt(start)
+    d2 = _fmt(start + rng.integers(30, 900, size=n).astype("timedelta64[D]"))
+    d3 = _fmt(start + rng.integers(900, 1500, size=n).astype("timedelta64[D]"))
+    second_leg = rng.random(n) < REEMBARK_RATE
+
+    out = []
+    for i in range(n):
+        fields = {"p1": PLACE_NAMES[p1[i]], "p2": PLACE_NAMES[p2[i]], "d1": d1[i], "d2": d2[i], "ship": SHIP_NAMES[ships[i]]}
+        remark = EMBARK_TEMPLATES[emb[i]].format(**fields) + ", " + DISEMBARK_TEMPLATES[dis[i]].format(**fields)
+        if second_leg[i]:
+            remark += f", rembarqué à {fields['p2']} le {d2[i]}, débarqué à {fields['p1']} le {d3[i]}"
+        out.append(remark)
+    return pd.Series(out, name="Remarks")
+
+
+def make_person_table(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed + 1)
+    return pd.DataFrame({
+        "person_id": np.arange(n),
+        "Last Name": np.array(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), size=n)],
+        "First Name": np.array(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), size=n)],
+        "Function": np.array(FUNCTIONS, dtype=object)[rng.integers(0, len(FUNCTIONS), size=n)],
+    })
+
+
+def make_voyage_table(n_voyages: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed + 2)
+    codes = [f"V{i:07d}" for i in range(n_voyages)]
+    return pd.DataFrame({
+        "voyage_id": codes,
+        "voyage_code": codes,
+        "ship_id": rng.integers(0, max(1, n_voyages // 4), size=n_voyages),
+        "departure": _fmt(_dates(rng, n_voyages)),
+    })
+
+
+def make_crew_table(n: int, seed: int = 0) -> pd.DataFrame:
+    """Pipeline input: one row per crew record with remarks and person fields."""
+    rng = np.random.default_rng(seed + 3)
+    person = make_person_table(n, seed)
+    n_voyages = max(1, n // 100)
+    crew = person.drop(columns="person_id").assign(
+        Remarks=make_remarks(n, seed),
+        Emb_loc=np.nan,
+        Disemb_loc=np.nan,
+        voyage_id=[f"V{i:07d}" for i in rng.integers(0, n_voyages, size=n)],
+    )
+    crew["place"] = np.array(PLACE_NAMES, dtype=object)[rng.integers(0, len(PLACE_NAMES), size=n)]
+    return crew
+
+
+def make_legs(n: int, seed: int = 0) -> pd.DataFrame:
+    """Voyage legs for build_routes_graph."""
+    rng = np.random.default_rng(seed + 4)
+    names = np.array(PLACE_NAMES, dtype=object)
+    return pd.DataFrame({
+        "from_place": names[rng.integers(0, len(names), size=n)],
+        "to_place": names[rng.integers(0, len(names), size=n)],
+    })
+
+
+def make_stop_sequences(n_voyages: int, seed: int = 0, max_stops: int = 6) -> List[List[str]]:
+    rng = np.random.default_rng(seed + 5)
+    lengths = rng.integers(2, max_stops + 1, size=n_voyages)
+    return [[PLACE_NAMES[j] for j in rng.integers(0, len(PLACE_NAMES), size=k)] for k in lengths]
+
+
+def latlon_map() -> Dict[str, List[float]]:
+    return {name: [lat, lon] for name, (lat, lon) in PLACES.items()}
+
+
+class StandInGeograph:
+    """
+    Deterministic local replacement for scgraph's marnet_geograph: a straight line in
+    lat/lon between origin and destination with roughly one point per degree.
+    """
+
+    def get_shortest_path(self, origin_node, destination_node):
+        lat0, lon0 = origin_node["latitude"], origin_node["longitude"]
+        lat1, lon1 = destination_node["latitude"], destination_node["longitude"]
+        steps = int(max(abs(lat1 - lat0), abs(lon1 - lon0))) + 2
+        t = np.linspace(0.0, 1.0, steps)
+        path = np.column_stack([lat0 + (lat1 - lat0) * t, lon0 + (lon1 - lon0) * t])
+        return {"coordinate_path": path.tolist(), "length": float(steps)}
@@ -2,12 +2,39 @@
 ships package
 Provides data IO, cleaning, transform, join, routing and visualization helpers
 for the historical ships / voyages dataset.
+
+Public names are imported lazily on first access, so `import ships` (and the
+CLI or a worker that only needs the extractor) does not pay for pandas,
+networkx or matplotlib until they are actually used.
 """
 
-from .data_io import load_csv, load_parquet, save_parquet
-from .cleaning import normalize_place, clean_places_df, fix_voyage_ids
-from .transforms import explode_slash_indices, extract_from_remarks
-from .joins import join_ship_record_tables, make_joined_table
-from .routes import build_routes_graph, route_coordinates_from_voyage
-from .viz import plot_route_map, plot_routes_graph
-from .cli import main
\ No newline at end of file
+import importlib
+
+# public name -> submodule defining it
+_EXPORTS = {
+    "load_csv": "data_io", "load_csvs": "data_io", "load_parquet": "data_io",
+    "save_parquet": "data_io", "write_parquet_batches": "data_io",
+    "normalize_place": "cleaning", "clean_places_df": "cleaning", "fix_voyage_ids": "cleaning",
+    "validate_table": "cleaning",
+    "explode_slash_indices": "transforms", "extract_from_remarks": "transforms",
+    "join_ship_record_tables": "joins", "make_joined_table": "joins",
+    "join_star_schema": "joins", "Dimension": "joins",
+    "build_routes_graph": "routes", "route_coordinates_from_voyage": "routes",
+    "plot_route_map": "viz", "plot_routes_graph": "viz",
+    "build_store": "store", "open_store": "store", "lookup": "store",
+    "parse_dates": "temporal", "days_on_voyage": "temporal", "AboardIndex": "temporal",
+    "main": "cli",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,13 +2,16 @@
 - normalize place names
 - fix alternative names
 - fix voyage ids, remove stray indices
+- validate table structure (required / non-null / unique columns)
 """
 
 import re
-from typing import Optional
+from typing import Iterable, List, Optional
 import pandas as pd
 import logging
 
+from .temporal import DATE_FORMAT, parse_dates
+
 logger = logging.getLogger(__name__)
 
 PLACE_NORMALIZATION = {
@@ -53,13 +56,42 @@ def fix_voyage_ids(df: pd.DataFrame, id_col: str = "voyage_id") -> pd.DataFrame:
     df[id_col] = df[id_col].apply(_clean_id)
     return df
 
-def standardize_dates(df, col):
-    """Convert dates to dd/mm/yyyy format."""
-    df[col] = pd.to_datetime(df[col], errors="coerce").dt.strftime("%d/%m/%Y")
+def standardize_dates(df, col, as_text: bool = True):
+    """
+    Convert dates to dd/mm/yyyy format. With as_text=False keep the parsed
+    datetime64 column instead of formatting it back to text.
+    """
+    parsed = parse_dates(df[col], fmt=None)
+    df[col] = parsed.dt.strftime(DATE_FORMAT) if as_text else parsed
     return df
 
 def clean_text(text):
     """Remove [nan], normalize spacing, strip whitespace."""
     if pd.isna(text):
         return None
-    return str(text).replace("[nan]", "").strip()
\ No newline at end of file
+    return str(text).replace("[nan]", "").strip()
+
+def validate_table(df: pd.DataFrame, required: Iterable[str] = (), not_null: Iterable[str] = (),
+                   unique: Iterable[str] = ()) -> List[str]:
+    """
+    Check required columns exist, not_null columns have no missing values and
+    unique columns have no duplicated (non-missing) values. Columns named in
+    not_null / unique must exist too.
+    Returns a list of human-readable problems; empty means the table is valid.
+    """
+    not_null, unique = list(not_null), list(unique)
+    problems = []
+    for col in dict.fromkeys([*required, *not_null, *unique]):
+        if col not in df.columns:
+            problems.append(f"missing column '{col}'")
+    for col in not_null:
+        if col in df.columns:
+            n = int(df[col].isna().sum())
+            if n:
+                problems.append(f"column '{col}' has {n} missing values")
+    for col in unique:
+        if col in df.columns:
+            n = int(df[col].dropna().duplicated().sum())
+            if n:
+                problems.append(f"column '{col}' has {n} duplicated values")
+    return problems
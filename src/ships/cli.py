@@ -2,44 +2,189 @@
 
 import argparse
 import logging
+import sys
 from pathlib import Path
 
-from .data_io import load_csv, save_parquet
-from .cleaning import clean_places_df, fix_voyage_ids
-from .joins import make_joined_table
+from . import profiling
+from .store import STORE_TABLES
+
+# command implementations import pandas & co. inside the function, so `ships --help`
+# and argument errors return without loading the data stack
 
 logger = logging.getLogger(__name__)
 
+_COMMANDS = ("clean", "store", "pipeline", "routes", "validate")
+
 def _setup_logging(level=logging.INFO):
     logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-def main():
-    parser = argparse.ArgumentParser(prog="ships", description="Ships dataset utilities")
-    parser.add_argument("--input", "-i", required=True, help="Input CSV (or multiple, comma-separated)")
-    parser.add_argument("--out", "-o", required=True, help="Output parquet path")
-    parser.add_argument("--clean-places", action="store_true", help="Run place cleaning")
-    parser.add_argument("--fix-voyage-ids", action="store_true", help="Normalize voyage IDs")
-    args = parser.parse_args()
-    _setup_logging()
-    inputs = [p.strip() for p in args.input.split(",")]
-    dfs = []
-    for p in inputs:
-        logger.info("Loading %s", p)
-        df = load_csv(p)
-        dfs.append(df)
-    if len(dfs) == 1:
-        df = dfs[0]
+def _split_list(value):
+    return [p.strip() for p in value.split(",") if p.strip()] if value else []
+
+def _clean_batch(df, args):
+    from .cleaning import clean_places_df, fix_voyage_ids
+    if args.clean_places:
+        df = clean_places_df(df, column='place')
+    if args.fix_voyage_ids:
+        df = fix_voyage_ids(df, id_col='voyage_id')
+    return df
+
+def _cmd_clean(args):
+    from .data_io import infer_csv_dtypes, iter_csv_batches, iter_frame_batches, load_csvs, write_parquet_batches
+    from .joins import make_joined_table
+    inputs = _split_list(args.input)
+    if len(inputs) == 1:
+        # a single input never needs to be fully in memory: clean and write it chunk by chunk
+        # chunks are typed independently; a cheap first pass pins each column's dtype for
+        # the whole file so every row group matches the schema of the first one
+        with profiling.stage("infer_dtypes"):
+            dtypes = infer_csv_dtypes(inputs[0], batch_rows=args.batch_rows)
+        logger.info("Streaming %s", inputs[0])
+        batches = iter_csv_batches(inputs[0], batch_rows=args.batch_rows, dtype=dtypes)
     else:
-        df = make_joined_table(dfs)
+        with profiling.stage("load") as rec:
+            logger.info("Loading %s", ", ".join(inputs))
+            dfs = load_csvs(inputs, max_workers=args.workers)
+            rec.rows_out = sum(len(d) for d in dfs)
+        with profiling.stage("join", rows_in=rec.rows_out) as rec:
+            df = make_joined_table(dfs)
+            rec.rows_out = len(df)
+        del dfs
+        batches = iter_frame_batches(df, batch_rows=args.batch_rows)
     if args.clean_places:
         logger.info("Cleaning place names")
-        df = clean_places_df(df, column='place')
     if args.fix_voyage_ids:
         logger.info("Fixing voyage ids")
-        df = fix_voyage_ids(df, id_col='voyage_id')
     out_path = Path(args.out)
-    save_parquet(df, out_path)
-    logger.info("Saved %s", out_path)
+    with profiling.stage("clean_and_save") as rec:
+        rec.rows_out = write_parquet_batches((_clean_batch(b, args) for b in batches), out_path,
+                                             partition_col=args.partition_by)
+    logger.info("Saved %d rows to %s", rec.rows_out, out_path)
+
+def _cmd_store(args):
+    from .data_io import load_csvs
+    from .store import build_store
+    paths = {table: getattr(args, table) for table in STORE_TABLES if getattr(args, table)}
+    if not paths:
+        raise SystemExit("ships store: give at least one of " + ", ".join(f"--{t}" for t in STORE_TABLES))
+    with profiling.stage("load") as rec:
+        logger.info("Loading %s", ", ".join(f"{t} from {p}" for t, p in paths.items()))
+        tables = dict(zip(paths, load_csvs(list(paths.values()), max_workers=args.workers)))
+        rec.rows_out = sum(len(t) for t in tables.values())
+    with profiling.stage("build_store", rows_in=rec.rows_out):
+        db_path = build_store(args.db, tables)
+    logger.info("Store written to %s (%s)", db_path, ", ".join(tables))
+
+def _cmd_pipeline(args):
+    from .pipeline import run_pipeline
+    df = run_pipeline(args.input, None, args.out)
+    logger.info("Processed %d rows into %s", len(df), args.out)
+
+def _cmd_routes(args):
+    import networkx as nx
+    from .data_io import load_csv
+    from .routes import build_routes_graph
+    with profiling.stage("load") as rec:
+        legs = load_csv(args.input, usecols=[args.from_col, args.to_col])
+        rec.rows_out = len(legs)
+    with profiling.stage("build_routes_graph", rows_in=len(legs)) as rec:
+        G = build_routes_graph(legs, from_col=args.from_col, to_col=args.to_col)
+        rec.rows_out = G.number_of_edges()
+    edges = nx.to_pandas_edgelist(G, source=args.from_col, target=args.to_col)
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    edges.sort_values("count", ascending=False).to_csv(out_path, index=False)
+    logger.info("Wrote %d edges between %d places to %s", len(edges), G.number_of_nodes(), out_path)
+
+def _cmd_validate(args):
+    from .cleaning import validate_table
+    from .data_io import load_csvs
+    inputs = _split_list(args.input)
+    with profiling.stage("load") as rec:
+        dfs = load_csvs(inputs, max_workers=args.workers)
+        rec.rows_out = sum(len(d) for d in dfs)
+    failed = False
+    for path, df in zip(inputs, dfs):
+        problems = validate_table(df, required=_split_list(args.require),
+                                  not_null=_split_list(args.not_null), unique=_split_list(args.unique))
+        for problem in problems:
+            logger.error("%s: %s", path, problem)
+        if not problems:
+            logger.info("%s: OK (%d rows)", path, len(df))
+        failed = failed or bool(problems)
+    if failed:
+        raise SystemExit(1)
+
+def _add_workers(parser):
+    parser.add_argument("--workers", type=int, default=None, help="Threads used to load multiple inputs")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ships", description="Ships dataset utilities")
+    sub = parser.add_subparsers(dest="command")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile", nargs="?", const="-", default=None, metavar="PATH",
+                        help="Write a JSON timing/memory report to PATH (stdout if no PATH)")
+
+    clean = sub.add_parser("clean", parents=[common], help="Load, optionally clean and save CSV input as parquet (default command)")
+    clean.add_argument("--input", "-i", required=True, help="Input CSV (or multiple, comma-separated)")
+    clean.add_argument("--out", "-o", required=True, help="Output parquet path")
+    clean.add_argument("--clean-places", action="store_true", help="Run place cleaning")
+    clean.add_argument("--fix-voyage-ids", action="store_true", help="Normalize voyage IDs")
+    _add_workers(clean)
+    clean.add_argument("--batch-rows", type=int, default=100_000, help="Rows per parquet row group")
+    clean.add_argument("--partition-by", default=None, metavar="COLUMN",
+                       help="Write a directory dataset partitioned by COLUMN (e.g. voyage_code); OUT must be new or empty")
+    clean.set_defaults(func=_cmd_clean)
+
+    store = sub.add_parser("store", parents=[common], help="Build or refresh the indexed SQLite store")
+    store.add_argument("--db", required=True, help="SQLite store path")
+    _add_workers(store)
+    for table in STORE_TABLES:
+        store.add_argument(f"--{table}", help=f"CSV for the {table} table")
+    store.set_defaults(func=_cmd_store)
+
+    pipeline = sub.add_parser("pipeline", parents=[common], help="Run the crew-movement processing pipeline")
+    pipeline.add_argument("--input", "-i", required=True, help="Input crew CSV")
+    pipeline.add_argument("--out", "-o", required=True, help="Output CSV path")
+    pipeline.set_defaults(func=_cmd_pipeline)
+
+    routes = sub.add_parser("routes", parents=[common], help="Build the routes graph and write its weighted edge list")
+    routes.add_argument("--input", "-i", required=True, help="CSV of voyage legs")
+    routes.add_argument("--out", "-o", required=True, help="Output edge list CSV")
+    routes.add_argument("--from-col", default="from_place")
+    routes.add_argument("--to-col", default="to_place")
+    routes.set_defaults(func=_cmd_routes)
+
+    validate = sub.add_parser("validate", parents=[common], help="Check tables for missing columns, nulls and duplicates")
+    validate.add_argument("--input", "-i", required=True, help="Input CSV (or multiple, comma-separated)")
+    _add_workers(validate)
+    validate.add_argument("--require", default=None, help="Comma-separated columns that must exist")
+    validate.add_argument("--not-null", default=None, help="Comma-separated columns that must have no missing values")
+    validate.add_argument("--unique", default=None, help="Comma-separated columns whose values must be unique")
+    validate.set_defaults(func=_cmd_validate)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # keep `ships --input ... --out ...` working: no subcommand means `clean`
+    if argv and argv[0] not in _COMMANDS and argv[0] not in ("-h", "--help"):
+        argv = ["clean"] + argv
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return
+    _setup_logging()
+    if not args.profile:
+        args.func(args)
+        return
+    profiling.enable()
+    try:
+        with profiling.stage(f"ships {args.command}"):
+            args.func(args)
+    finally:
+        profiling.write_report(args.profile)
+        profiling.disable()
 
 if __name__ == "__main__":
     main()
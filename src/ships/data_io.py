@@ -1,10 +1,15 @@
 """
-I/O helpers: load CSV/Parquet safely, small-sample creation helpers.
+I/O helpers: load CSV/Parquet safely, small-sample creation helpers,
+concurrent CSV loading and batched (streaming) parquet output.
 """
 
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from urllib.parse import quote
 import pandas as pd
-from typing import Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 def load_csv(path: Union[str, Path], **kwargs) -> pd.DataFrame:
     path = Path(path)
@@ -22,3 +27,156 @@ def save_parquet(df: pd.DataFrame, path: Union[str, Path], index: bool=False):
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     df.to_parquet(path, index=index)
+
+def _csv_engine() -> str:
+    """pyarrow's CSV parser is multithreaded and releases the GIL; fall back to pandas' C parser."""
+    try:
+        import pyarrow  # noqa: F401
+        return "pyarrow"
+    except ImportError:
+        return "c"
+
+def _is_temporal(values: pd.Series) -> bool:
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return True
+    if values.dtype != object:
+        return False
+    first = values.first_valid_index()
+    return first is not None and isinstance(values[first], (datetime.date, datetime.time))
+
+def _load_csv_pyarrow(path: Union[str, Path], **kwargs) -> pd.DataFrame:
+    """
+    load_csv with the pyarrow engine, returning the dtypes the C parser would.
+    pyarrow turns ISO dates / times / timestamps into date and datetime values
+    where the C parser keeps text, so those columns are read again as text.
+    """
+    df = load_csv(path, engine="pyarrow", **kwargs)
+    temporal = [c for c in df.columns if _is_temporal(df[c])]
+    if not temporal:
+        return df
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    text = pa_csv.read_csv(
+        str(path),
+        parse_options=pa_csv.ParseOptions(delimiter=kwargs.get("sep", ",")),
+        convert_options=pa_csv.ConvertOptions(include_columns=temporal, strings_can_be_null=True,
+                                              column_types={c: pa.string() for c in temporal}),
+    ).to_pandas()
+    for col in temporal:
+        df[col] = text[col].array
+    return df
+
+def load_csvs(paths: List[Union[str, Path]], max_workers: Optional[int] = None, **kwargs) -> List[pd.DataFrame]:
+    """
+    Load several CSVs concurrently on a thread pool; results keep the order of paths.
+    The engine does not change the dtypes, so the same file loads the same way here
+    as through load_csv / iter_csv_batches.
+    """
+    engine = kwargs.pop("engine", _csv_engine())
+    load = _load_csv_pyarrow if engine == "pyarrow" else partial(load_csv, engine=engine)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda p: load(p, **kwargs), paths))
+
+def iter_csv_batches(path: Union[str, Path], batch_rows: int = 100_000, **kwargs) -> Iterator[pd.DataFrame]:
+    """Read a CSV as DataFrames of at most batch_rows rows."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"{path} does not exist")
+    with pd.read_csv(path, chunksize=batch_rows, **kwargs) as reader:
+        yield from reader
+
+def infer_csv_dtypes(path: Union[str, Path], batch_rows: int = 100_000, **kwargs) -> Dict[str, str]:
+    """
+    Column dtypes for a whole CSV, from one chunked pass. read_csv(chunksize=...)
+    infers each chunk on its own, so a column that is empty in one chunk (float64)
+    and text in the next would change type mid-stream; pass the result as
+    iter_csv_batches(..., dtype=...) to pin them. As in a full read, text beats
+    numbers, missing values turn int into float64 and a column without any value
+    is float64; bools with missing values become the nullable "boolean" dtype.
+    """
+    seen: Dict[str, set] = {}
+    has_null: Dict[str, bool] = {}
+    for chunk in iter_csv_batches(path, batch_rows=batch_rows, **kwargs):
+        for col in chunk.columns:
+            values = chunk[col]
+            nulls = values.isna()
+            has_null[col] = has_null.get(col, False) or bool(nulls.any())
+            kinds = seen.setdefault(col, set())
+            if not nulls.all():
+                # a bool column with gaps comes back as object
+                boolean = values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) == "boolean"
+                kinds.add("b" if boolean else values.dtype.kind)
+    dtypes = {}
+    for col, kinds in seen.items():
+        if not kinds or kinds <= {"i", "f"} and ("f" in kinds or has_null[col]):
+            dtypes[col] = "float64"
+        elif kinds == {"i"}:
+            dtypes[col] = "int64"
+        elif kinds == {"b"}:
+            dtypes[col] = "boolean" if has_null[col] else "bool"
+        else:
+            dtypes[col] = "str"  # the parser's own text dtype (object before pandas 3)
+    return dtypes
+
+def iter_frame_batches(df: pd.DataFrame, batch_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), batch_rows):
+        yield df.iloc[start:start + batch_rows]
+
+def _partition_dir(column: str, value) -> str:
+    """Hive-style directory name, as pyarrow datasets expect (path/<col>=<value>)."""
+    if pd.isna(value):
+        return f"{column}=__HIVE_DEFAULT_PARTITION__"
+    return f"{column}={quote(str(value), safe='')}"
+
+def write_parquet_batches(batches: Iterable[pd.DataFrame], path: Union[str, Path],
+                          partition_col: Optional[str] = None, schema=None) -> int:
+    """
+    Stream DataFrame batches to parquet, one row group per batch, without holding
+    the whole table in memory. The first batch fixes the schema unless a pyarrow
+    schema is given, so batches must agree on column dtypes (for CSV chunks, pin
+    them with infer_csv_dtypes).
+
+    With partition_col the output is a directory dataset instead of one file: each
+    value gets one file, path/<col>=<value>/part-0.parquet, with one row group per
+    batch that contains it. The directory must not exist yet or be empty, so a
+    rerun never mixes with the files of an earlier one.
+    Returns the number of rows written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    if partition_col is not None and path.exists() and (not path.is_dir() or any(path.iterdir())):
+        raise FileExistsError(f"{path} already exists and is not an empty directory")
+    writers = {}  # partition value (None for a single file) -> ParquetWriter
+    rows = 0
+    try:
+        for batch in batches:
+            if schema is None:
+                schema = pa.Schema.from_pandas(batch, preserve_index=False)
+                # an all-missing text column in the first batch must not pin the type to null
+                schema = pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in schema],
+                                   metadata=schema.metadata)
+            if partition_col is None:
+                parts = [(None, batch)]
+            else:
+                # the partition value lives in the directory name, not in the files
+                parts = batch.drop(columns=partition_col).groupby(batch[partition_col], dropna=False,
+                                                                    sort=False, observed=True)
+            for value, part in parts:
+                value = None if pd.isna(value) else value  # NaN keys would never match again
+                writer = writers.get(value)
+                if writer is None:
+                    if partition_col is None:
+                        target, file_schema = path, schema
+                    else:
+                        target = path / _partition_dir(partition_col, value) / "part-0.parquet"
+                        file_schema = schema.remove(schema.get_field_index(partition_col))
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    writer = writers[value] = pq.ParquetWriter(str(target), file_schema)
+                writer.write_table(pa.Table.from_pandas(part, schema=writer.schema, preserve_index=False))
+            rows += len(batch)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return rows
@@ -1,5 +1,19 @@
 import re
-import pandas as pd
+import time
+from . import profiling
+
+# value for a field that was not found; None rather than pd.NA so that regex workers
+# importing this module do not have to load pandas (pd.isna treats both alike)
+MISSING = None
+
+def _search(name, pattern, text):
+    """re.search with IGNORECASE; counts hits and time per pattern when profiling is on."""
+    if not profiling.is_enabled():
+        return re.search(pattern, text, flags=re.IGNORECASE)
+    start = time.perf_counter()
+    match = re.search(pattern, text, flags=re.IGNORECASE)
+    profiling.count(f"extractor.{name}", time.perf_counter() - start, hit=match is not None)
+    return match
 
 def extract_date(text):
     if not text:
@@ -85,10 +99,10 @@ def extract_details(text):
     }
 
     # Initialize results
-    embark_location = pd.NA
-    embark_date = pd.NA
-    disembark_location = pd.NA
-    disembark_date = pd.NA
+    embark_location = MISSING
+    embark_date = MISSING
+    disembark_location = MISSING
+    disembark_date = MISSING
 
     # Initialize match variables
     embark_date_match = None
@@ -98,20 +112,20 @@ def extract_details(text):
 
     # Determine which embark patterns to use
     if 'embarqué' in text.lower() or 'rembarqué' in text.lower():
-        embark_date_match = re.search(embark_patterns['embarqué']['date'], text, flags=re.IGNORECASE)
-        embark_location_match = re.search(embark_patterns['embarqué']['location'], text, flags=re.IGNORECASE)
+        embark_date_match = _search('embark.embarqué.date', embark_patterns['embarqué']['date'], text)
+        embark_location_match = _search('embark.embarqué.location', embark_patterns['embarqué']['location'], text)
     elif 'fait la campagne' in text.lower():
-        embark_date_match = re.search(embark_patterns['a fait la']['date'], text, flags=re.IGNORECASE)
-        embark_location_match = re.search(embark_patterns['a fait la']['location'], text, flags=re.IGNORECASE)
+        embark_date_match = _search('embark.a fait la.date', embark_patterns['a fait la']['date'], text)
+        embark_location_match = _search('embark.a fait la.location', embark_patterns['a fait la']['location'], text)
     elif 'supplément' in text.lower():
-        embark_date_match = re.search(embark_patterns['supplément']['date'], text, flags=re.IGNORECASE)
-        embark_location_match = re.search(embark_patterns['supplément']['location'], text, flags=re.IGNORECASE)
+        embark_date_match = _search('embark.supplément.date', embark_patterns['supplément']['date'], text)
+        embark_location_match = _search('embark.supplément.location', embark_patterns['supplément']['location'], text)
     elif 'remplacement' in text.lower():
-        embark_date_match = re.search(embark_patterns['remplacement']['date'], text, flags=re.IGNORECASE)
-        embark_location_match = re.search(embark_patterns['remplacement']['location'], text, flags=re.IGNORECASE)
+        embark_date_match = _search('embark.remplacement.date', embark_patterns['remplacement']['date'], text)
+        embark_location_match = _search('embark.remplacement.location', embark_patterns['remplacement']['location'], text)
     elif 'trouvé' in text.lower():
-        embark_date_match = re.search(embark_patterns['trouvé']['date'], text, flags=re.IGNORECASE)
-        embark_location_match = re.search(embark_patterns['trouvé']['location'], text, flags=re.IGNORECASE)        
+        embark_date_match = _search('embark.trouvé.date', embark_patterns['trouvé']['date'], text)
+        embark_location_match = _search('embark.trouvé.location', embark_patterns['trouvé']['location'], text)        
 
     # Extract embark information
     if embark_date_match:
@@ -121,23 +135,23 @@ def extract_details(text):
 
     # Determine which disembark patterns to use
     if 'débarqué' in text.lower():
-        disembark_date_match = re.search(disembark_patterns['débarqué']['date'], text, flags=re.IGNORECASE)
-        disembark_location_match = re.search(disembark_patterns['débarqué']['location'], text, flags=re.IGNORECASE)
+        disembark_date_match = _search('disembark.débarqué.date', disembark_patterns['débarqué']['date'], text)
+        disembark_location_match = _search('disembark.débarqué.location', disembark_patterns['débarqué']['location'], text)
     elif 'déserté' in text.lower():
-        disembark_date_match = re.search(disembark_patterns['déserté']['date'], text, flags=re.IGNORECASE)
-        disembark_location_match = re.search(disembark_patterns['déserté']['location'], text, flags=re.IGNORECASE)
+        disembark_date_match = _search('disembark.déserté.date', disembark_patterns['déserté']['date'], text)
+        disembark_location_match = _search('disembark.déserté.location', disembark_patterns['déserté']['location'], text)
     elif 'mort' in text.lower():
-        disembark_date_match = re.search(disembark_patterns['mort en mer']['date'], text, flags=re.IGNORECASE)
-        disembark_location_match = re.search(disembark_patterns['mort en mer']['location'], text, flags=re.IGNORECASE)
+        disembark_date_match = _search('disembark.mort en mer.date', disembark_patterns['mort en mer']['date'], text)
+        disembark_location_match = _search('disembark.mort en mer.location', disembark_patterns['mort en mer']['location'], text)
     elif 'passé' in text.lower():
-        disembark_date_match = re.search(disembark_patterns['passé']['date'], text, flags=re.IGNORECASE)
-        disembark_location_match = re.search(disembark_patterns['passé']['location'], text, flags=re.IGNORECASE)
+        disembark_date_match = _search('disembark.passé.date', disembark_patterns['passé']['date'], text)
+        disembark_location_match = _search('disembark.passé.location', disembark_patterns['passé']['location'], text)
     elif 'fait la campagne' in text.lower():
-        disembark_date_match = re.search(disembark_patterns['a fait la']['date'], text, flags=re.IGNORECASE)
-        disembark_location_match = re.search(disembark_patterns['a fait la']['location'], text, flags=re.IGNORECASE)
+        disembark_date_match = _search('disembark.a fait la.date', disembark_patterns['a fait la']['date'], text)
+        disembark_location_match = _search('disembark.a fait la.location', disembark_patterns['a fait la']['location'], text)
     elif 'resté' in text.lower():
-        disembark_date_match = re.search(disembark_patterns['resté']['date'], text, flags=re.IGNORECASE)
-        disembark_location_match = re.search(disembark_patterns['resté']['location'], text, flags=re.IGNORECASE)
+        disembark_date_match = _search('disembark.resté.date', disembark_patterns['resté']['date'], text)
+        disembark_location_match = _search('disembark.resté.location', disembark_patterns['resté']['location'], text)
 
     # Extract disembark information
     if disembark_date_match:
@@ -2,8 +2,9 @@
 Join and table-making helpers
 """
 
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import Dict, List, NamedTuple, Optional
 
 def join_ship_record_tables(ship_df: pd.DataFrame, record_df: pd.DataFrame,
                             left_on='ship_id', right_on='ship_id',
@@ -13,10 +14,128 @@ def join_ship_record_tables(ship_df: pd.DataFrame, record_df: pd.DataFrame,
 def make_joined_table(tables: List[pd.DataFrame], on: str='voyage_id', how: str='outer') -> pd.DataFrame:
     """
     Sequentially join list of tables on a common key.
+    For a fact table plus many-to-one lookups (record -> person/voyage/ship/...)
+    prefer join_star_schema, which does not grow the output.
     """
     if not tables:
         raise ValueError("tables list is empty")
     out = tables[0].copy()
     for t in tables[1:]:
         out = out.merge(t, on=on, how=how)
-    return out
\ No newline at end of file
+    return out
+
+
+class Dimension(NamedTuple):
+    """
+    A dimension table in a star join.
+    key: column in `table` identifying its rows.
+    fact_key: column in the fact table referencing `key` (defaults to `key`).
+    columns: dimension columns to bring in (defaults to all except the key).
+    """
+    table: pd.DataFrame
+    key: str
+    fact_key: Optional[str] = None
+    columns: Optional[List[str]] = None
+
+
+def _align_keys(fact_keys: pd.Series, dim_keys: pd.Series):
+    """Bring both key columns to a common dtype so lookups do not silently miss."""
+    if isinstance(fact_keys.dtype, pd.CategoricalDtype):
+        fact_keys = fact_keys.astype(fact_keys.cat.categories.dtype)
+    if isinstance(dim_keys.dtype, pd.CategoricalDtype):
+        dim_keys = dim_keys.astype(dim_keys.cat.categories.dtype)
+    if fact_keys.dtype == dim_keys.dtype:
+        return fact_keys, dim_keys
+    numeric = pd.api.types.is_numeric_dtype
+    if numeric(fact_keys.dtype) and numeric(dim_keys.dtype):
+        return fact_keys.astype('float64'), dim_keys.astype('float64')
+    # mixed (e.g. int ids in one table, strings in the other): compare as text
+    def as_text(s):
+        if pd.api.types.is_float_dtype(s.dtype):
+            values = s.dropna()
+            if (values == np.floor(values)).all():
+                s = s.astype('Int64')  # CSV int ids with gaps are read as float: 1.0 must match "1"
+        return s.astype(object).where(s.isna(), s.astype(str))
+    return as_text(fact_keys), as_text(dim_keys)
+
+
+def _row_multiplier(fact_keys: pd.Series, dim_keys: pd.Series) -> np.ndarray:
+    """Rows a left merge produces per fact row, computed from key counts only."""
+    counts = dim_keys.value_counts()
+    return fact_keys.map(counts).fillna(1).to_numpy(dtype="float64")
+
+
+def join_star_schema(fact: pd.DataFrame, dimensions: Dict[str, Dimension],
+                     fact_columns: Optional[List[str]] = None,
+                     max_fanout: float = 1.0) -> pd.DataFrame:
+    """
+    Left-join dimension tables onto a fact table (e.g. record -> person, voyage,
+    ship, origin, function) without materializing intermediate merges.
+
+    Many-to-one dimensions are resolved with an indexed lookup over the factorized
+    fact keys, so the result has exactly one row per fact row. If dimension keys are
+    duplicated, the combined output size of those dimensions is computed first and a
+    ValueError is raised when it would exceed `max_fanout` times the fact table;
+    otherwise they fall back to regular merges. Only `fact_columns` (default all) and each dimension's
+    requested columns are built. Name clashes are suffixed with `_<dimension name>`.
+    The fact index is kept; rows added by fan-out repeat their fact row's label.
+    """
+    if fact_columns is None:
+        fact_columns = list(fact.columns)
+    out = {c: fact[c] for c in fact_columns}
+    expanded = []
+    multiplier = np.ones(len(fact))
+
+    for name, dim in dimensions.items():
+        fact_key = dim.fact_key or dim.key
+        for col, table in ((fact_key, fact), (dim.key, dim.table)):
+            if col not in table.columns:
+                raise KeyError(f"join key '{col}' missing for dimension '{name}'")
+        columns = dim.columns if dim.columns is not None else [c for c in dim.table.columns if c != dim.key]
+        missing = [c for c in columns if c not in dim.table.columns]
+        if missing:
+            raise KeyError(f"dimension '{name}' has no columns {missing}")
+
+        table = dim.table[dim.table[dim.key].notna()]
+        fact_keys, dim_keys = _align_keys(fact[fact_key], table[dim.key])
+        targets = {c: (f"{c}_{name}" if c in out else c) for c in columns}
+
+        if dim_keys.duplicated().any():
+            # fan-out compounds across dimensions, so check the running total
+            multiplier *= _row_multiplier(fact_keys, dim_keys)
+            rows = int(multiplier.sum())
+            if rows > max_fanout * len(fact):
+                names = [e[0] for e in expanded] + [name]
+                raise ValueError(
+                    f"joining dimensions {names} would produce {rows} rows "
+                    f"from {len(fact)} fact rows (max_fanout={max_fanout})"
+                )
+            expanded.append((name, fact_keys, dim_keys, table, targets))
+            continue
+
+        # factorize fact keys once, then resolve each distinct key against the dimension index
+        key_codes, uniques = pd.factorize(fact_keys)
+        positions = pd.Index(dim_keys).get_indexer(uniques)
+        codes = np.append(positions, -1).take(key_codes)  # code -1 (missing key) -> -1
+        for col, target in targets.items():
+            values = table[col]
+            values = values.array if isinstance(values.dtype, pd.api.extensions.ExtensionDtype) else values.to_numpy()
+            values = pd.api.extensions.take(values, codes, allow_fill=True)
+            out[target] = pd.Series(values, index=fact.index)
+
+    # every fan-out key is attached before the first merge, so later merges still see
+    # one key value per (already expanded) row
+    for name, fact_keys, _, _, _ in expanded:
+        out[f'__key_{name}'] = pd.Series(fact_keys.values, index=fact.index)
+    if expanded:
+        out['__row'] = pd.Series(np.arange(len(fact)), index=fact.index)  # merge drops the index
+    joined = pd.DataFrame(out, index=fact.index)
+    for name, _, dim_keys, table, targets in expanded:
+        key = f'__key_{name}'
+        right = pd.DataFrame({c: table[c] for c in targets})
+        right.columns = list(targets.values())
+        right[key] = dim_keys.values
+        joined = joined.merge(right, on=key, how='left').drop(columns=key)
+    if expanded:
+        joined.index = fact.index.take(joined.pop('__row').to_numpy())
+    return joined
@@ -1,37 +1,65 @@
 import pandas as pd
+from . import profiling
 from .cleaning import clean_text
 from .processor import process_rembarque, process_reembark, fill_emb_loc_for_rembarque
 from .classification import classify_embark, classify_disembark
 from .extractor import extract_date, extract_details
+from .temporal import add_typed_dates, days_on_voyage
 
-def run_pipeline(input_path, joined_path, output_path):
-    df = pd.read_csv(input_path)
-
-    # Step 1: Cleaning
+def clean_stage(df):
     df = df.dropna(how="all", axis=0).dropna(how="all", axis=1)
     for col in ["Remarks", "Emb_loc", "Disemb_loc"]:
         if col in df.columns:
             df[col] = df[col].map(clean_text)
+    return df
 
-    # Step 2: Expansion
+def expand_stage(df):
     df = process_rembarque(df)
+    # process_reembark orders each person's legs by Emb_date: sort dates, not dd/mm/yyyy text
+    df = add_typed_dates(df, ["Emb_date"])
     df = process_reembark(df)
     df = fill_emb_loc_for_rembarque(df)
+    return df
 
-    # Step 3: Extraction
-    df["Emb_date"] = df["Remarks"].map(extract_date)
-    df["Disemb_date"] = df["Remarks"].map(extract_date)
+def extract_stage(df):
     df["details"] = df["Remarks"].map(extract_details)
+    df["Emb_date"] = df["Remarks"].map(extract_date)
+    # extract_date returns the first date of the remark; the disembark date is the
+    # one extract_details found after débarqué / déserté / mort ...
+    df["Disemb_date"] = df["details"].str[3]
+    # parse the extracted dd/mm/yyyy text once; later steps work on datetime64
+    df = add_typed_dates(df, ["Emb_date", "Disemb_date"])
+    df["days_on_voyage"] = days_on_voyage(df)
+    return df
 
-    # Step 4: Classification
+def classify_stage(df):
     df["emb_class"] = df["Remarks"].map(classify_embark)
     df["disemb_class"] = df.apply(
         lambda row: classify_disembark(row["Remarks"], row.get("Emb_loc"), row.get("Disemb_loc")),
         axis=1
     )
+    return df
+
+# ordered (name, function) pairs; run_pipeline applies them in this order
+PIPELINE_STAGES = [
+    ("cleaning", clean_stage),
+    ("expansion", expand_stage),
+    ("extraction", extract_stage),
+    ("classification", classify_stage),
+]
+
+def run_pipeline(input_path, joined_path, output_path):
+    with profiling.stage("read") as rec:
+        df = pd.read_csv(input_path)
+        rec.rows_out = len(df)
+
+    for name, stage in PIPELINE_STAGES:
+        with profiling.stage(name, rows_in=len(df)) as rec:
+            df = stage(df)
+            rec.rows_out = len(df)
 
-    # Step 5: Save
-    df.to_csv(output_path, index=False)
+    with profiling.stage("write", rows_in=len(df)):
+        df.to_csv(output_path, index=False)
     return df
 
 if __name__ == "__main__":
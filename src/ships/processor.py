@@ -8,12 +8,12 @@ def process_rembarque(df):
         remarks = row.get("Remarks", "")
         segments = split_remarks(remarks)
         for seg in segments:
-            details = extract_details(seg)
+            embark_loc, embark_date, disembark_loc, _ = extract_details(seg)
             new_row = row.copy()
             new_row["Remarks"] = seg
-            new_row["Emb_loc"] = details.get("embark_loc")
-            new_row["Disemb_loc"] = details.get("disembark_loc")
-            new_row["Emb_date"] = details.get("date")
+            new_row["Emb_loc"] = embark_loc
+            new_row["Disemb_loc"] = disembark_loc
+            new_row["Emb_date"] = embark_date
             expanded_rows.append(new_row)
     return pd.DataFrame(expanded_rows)
 
@@ -0,0 +1,126 @@
+"""
+Opt-in instrumentation for pipeline stages and hot paths.
+Nothing is recorded unless enable() was called; while disabled, stage() and the
+counter helpers return after a single flag check.
+"""
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+_enabled = False
+_trace_memory = False
+_started_tracemalloc = False
+_lock = threading.Lock()
+_stages = []
+_open_stages = []  # nesting stack, so an outer stage's peak includes its inner stages
+_counters: Dict[str, list] = {}  # name -> [calls, hits, seconds]
+
+
+class StageRecord:
+    """Filled in by stage(); set rows_out before leaving the block."""
+    __slots__ = ("name", "rows_in", "rows_out", "seconds", "peak_mb", "_peak")
+
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.seconds = None
+        self.peak_mb = None
+        self._peak = 0
+
+
+def enable(trace_memory: bool = True):
+    """Start recording. trace_memory adds per-stage peak memory via tracemalloc (slower)."""
+    global _enabled, _trace_memory, _started_tracemalloc
+    reset()
+    _trace_memory = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    _enabled = True
+
+def disable():
+    global _enabled, _started_tracemalloc
+    _enabled = False
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+def is_enabled() -> bool:
+    return _enabled
+
+def reset():
+    with _lock:
+        _stages.clear()
+        _open_stages.clear()
+        _counters.clear()
+
+@contextmanager
+def stage(name: str, rows_in: Optional[int] = None):
+    """Time a block (and its peak memory when tracing) as one named stage."""
+    rec = StageRecord(name, rows_in)
+    if not _enabled:
+        yield rec
+        return
+    tracing = _trace_memory and tracemalloc.is_tracing()
+    if tracing:
+        _fold_peak()
+        tracemalloc.reset_peak()
+    _open_stages.append(rec)
+    start = time.perf_counter()
+    try:
+        yield rec
+    finally:
+        rec.seconds = time.perf_counter() - start
+        if tracing:
+            _fold_peak()
+            rec.peak_mb = rec._peak / 2**20
+        _open_stages.pop()
+        with _lock:
+            _stages.append(rec)
+
+def _fold_peak():
+    """Credit the traced peak since the last reset to every open stage."""
+    peak = tracemalloc.get_traced_memory()[1]
+    for rec in _open_stages:
+        rec._peak = max(rec._peak, peak)
+
+def count(name: str, seconds: float, hit: bool = True):
+    """Add one call (and its latency) to a named counter."""
+    with _lock:
+        c = _counters.get(name)
+        if c is None:
+            c = _counters[name] = [0, 0, 0.0]
+        c[0] += 1
+        c[1] += bool(hit)
+        c[2] += seconds
+
+def report() -> Dict:
+    with _lock:
+        stages = [
+            {"name": s.name, "seconds": round(s.seconds, 6), "rows_in": s.rows_in, "rows_out": s.rows_out,
+             "peak_mb": None if s.peak_mb is None else round(s.peak_mb, 3)}
+            for s in _stages
+        ]
+        counters = {
+            name: {"calls": calls, "hits": hits, "seconds": round(secs, 6),
+                   "mean_us": round(secs / calls * 1e6, 3) if calls else None}
+            for name, (calls, hits, secs) in sorted(_counters.items(), key=lambda kv: -kv[1][2])
+        }
+    return {"stages": stages, "counters": counters}
+
+def write_report(path: Union[str, Path, None] = None):
+    """Write report() as JSON to path, or to stdout when path is None or '-'."""
+    text = json.dumps(report(), indent=2)
+    if path is None or str(path) == "-":
+        sys.stdout.write(text + "\n")
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
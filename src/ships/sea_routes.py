@@ -9,26 +9,30 @@ Main capabilities:
 Notes:
 - This module assumes `marnet_geograph` (from scgraph.geographs.marnet) is available and
   provides get_shortest_path(origin_node, destination_node) -> dict with 'coordinate_path'.
-- Requires geopandas, shapely, matplotlib, pandas.
+- Requires geopandas, shapely, matplotlib, pandas (install the `geo` extra); the
+  geo libraries are imported on first use, not at module import.
 - Input file names are parameterized.
 """
 
-from typing import List, Dict, Tuple, Optional, Any
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional, Any
 import os
 import pickle
 import re
+import time
 import logging
 
 import pandas as pd
-import geopandas as gpd
-import matplotlib.pyplot as plt
-from shapely.geometry import Polygon, LineString
 
-# external (from your environment)
-try:
-    from scgraph.geographs.marnet import marnet_geograph
-except Exception:
-    marnet_geograph = None  # will raise later if used
+if TYPE_CHECKING:
+    from shapely.geometry import Polygon
+
+# geopandas / shapely / matplotlib are optional (`geo` extra) and imported where used
+
+# external (from your environment); loading it builds the whole marnet graph, so it is
+# imported on the first leg query. Assign a replacement here to route without scgraph.
+marnet_geograph = None
+
+from . import profiling
 
 logger = logging.getLogger(__name__)
 
@@ -86,12 +90,21 @@ def get_leg_path(origin: Tuple[float, float], destination: Tuple[float, float])
     origin/destination: (lat, lon)
     returns: list of (lat, lon) points (coordinate_path).
     """
+    global marnet_geograph
     if marnet_geograph is None:
-        raise RuntimeError("marnet_geograph not available in environment. Import failed.")
+        try:
+            from scgraph.geographs.marnet import marnet_geograph
+        except Exception:
+            raise RuntimeError("marnet_geograph not available in environment. Import failed.")
 
     origin_node = {"latitude": float(origin[0]), "longitude": float(origin[1])}
     dest_node = {"latitude": float(destination[0]), "longitude": float(destination[1])}
-    res = marnet_geograph.get_shortest_path(origin_node=origin_node, destination_node=dest_node)
+    if profiling.is_enabled():
+        start = time.perf_counter()
+        res = marnet_geograph.get_shortest_path(origin_node=origin_node, destination_node=dest_node)
+        profiling.count("sea_routes.get_leg_path", time.perf_counter() - start)
+    else:
+        res = marnet_geograph.get_shortest_path(origin_node=origin_node, destination_node=dest_node)
     # expected key 'coordinate_path'
     if 'coordinate_path' not in res:
         raise RuntimeError("marnet_geograph response missing 'coordinate_path'")
@@ -101,7 +114,7 @@ def get_leg_path(origin: Tuple[float, float], destination: Tuple[float, float])
 def assemble_full_path_from_stops(
     stops: List[str],
     pl_map: Dict[str, List[float]],
-    avoid_polygons: Optional[List[Polygon]] = None,
+    avoid_polygons: Optional[List["Polygon"]] = None,
     suse_alt_try_offset_deg: float = 2.0
 ) -> Tuple[List[Tuple[float, float]], List[str]]:
     """
@@ -112,6 +125,8 @@ def assemble_full_path_from_stops(
       - if still intersects, log and include the original path (no perfect avoidance)
     Returns tuple (path_points, missing_places_list)
     """
+    from shapely.geometry import LineString
+
     if avoid_polygons is None:
         avoid_polygons = []
 
@@ -197,6 +212,9 @@ def plot_route_on_world(
     by shapefile_geojson_path (NaturalEarth geojson). Also plot stop points (stops_coords).
     Saves figure to voyage_code + .png by default or returns the path to the saved image.
     """
+    import geopandas as gpd
+    import matplotlib.pyplot as plt
+
     world = gpd.read_file(shapefile_geojson_path)
     fig, ax = plt.subplots(1, 1, figsize=figsize)
     world.plot(ax=ax, color='white', edgecolor='black')
@@ -243,6 +261,8 @@ def visualize_voyage_from_files(
       - 'missing_places' : list
       - 'saved_fig' : filename
     """
+    from shapely.geometry import Polygon
+
     # load mother table
     stops_df = pd.read_csv(mother_table_csv).drop(columns=[c for c in ['Unnamed: 0'] if c in pd.read_csv(mother_table_csv).columns], errors='ignore').dropna(how='all', axis=0).dropna(how='all', axis=1)
     places_df = load_places(places_csv)
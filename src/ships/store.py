@@ -0,0 +1,136 @@
+"""
+Local SQLite store for the normalized ships dataset.
+Loads the record / person / voyage / ship / place / route tables once, indexes the
+lookup columns and serves point queries as DataFrames instead of rescanning CSVs.
+pandas is imported on use so the CLI can read STORE_TABLES without loading it.
+"""
+
+import os
+import shutil
+import sqlite3
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+STORE_TABLES = ("record", "person", "voyage", "ship", "place", "route")
+INDEXED_COLUMNS = ("voyage_code", "voyage_id", "person_id", "ship_id", "place", "place_name")
+
+StoreRef = Union[str, Path, sqlite3.Connection]
+
+def _check_table(table: str):
+    if table not in STORE_TABLES:
+        raise ValueError(f"unknown table '{table}', expected one of {STORE_TABLES}")
+
+def open_store(db_path: Union[str, Path]) -> sqlite3.Connection:
+    return sqlite3.connect(str(db_path))
+
+def _connect(db: StoreRef):
+    """Return (connection, owned) so helpers only close connections they opened."""
+    if isinstance(db, sqlite3.Connection):
+        return db, False
+    path = Path(db)
+    if not path.exists():
+        raise FileNotFoundError(f"{path} does not exist")
+    return open_store(path), True
+
+def load_table(conn: sqlite3.Connection, table: str, df: "pd.DataFrame", chunksize: int = 50_000):
+    """Replace `table` with the contents of df, then (re)create its lookup indexes."""
+    _check_table(table)
+    df.to_sql(table, conn, if_exists="replace", index=False, chunksize=chunksize)
+    # building indexes after the bulk insert is much cheaper than maintaining them row by row
+    for col in INDEXED_COLUMNS:
+        if col in df.columns:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "ix_{table}_{col}" ON "{table}" ("{col}")')
+    logger.info("Loaded %d rows into %s", len(df), table)
+
+def build_store(db_path: Union[str, Path], tables: Dict[str, "pd.DataFrame"], chunksize: int = 50_000) -> Path:
+    """
+    Create or refresh the store at db_path. Only the given tables are replaced;
+    any other table already in the store is left untouched.
+
+    The refresh is built in a temporary copy that replaces the store only once every
+    table has loaded, so a failed load leaves the previous store as it was.
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    if db_path.exists():
+        shutil.copyfile(db_path, tmp_path)
+    elif tmp_path.exists():
+        tmp_path.unlink()
+    try:
+        conn = open_store(tmp_path)
+        try:
+            # the copy is thrown away on failure, so trade durability for load speed
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            for table, df in tables.items():
+                load_table(conn, table, df, chunksize=chunksize)
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, db_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return db_path
+
+def list_tables(db: StoreRef) -> List[str]:
+    conn, owned = _connect(db)
+    try:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name").fetchall()
+    finally:
+        if owned:
+            conn.close()
+    return [r[0] for r in rows if r[0] in STORE_TABLES]
+
+def query(db: StoreRef, sql: str, params: Sequence = ()) -> "pd.DataFrame":
+    """Run an arbitrary (parameterized) SQL query against the store."""
+    import pandas as pd
+    conn, owned = _connect(db)
+    try:
+        return pd.read_sql_query(sql, conn, params=[_param(p) for p in params])
+    finally:
+        if owned:
+            conn.close()
+
+def _param(value):
+    """numpy scalars (e.g. df.person_id.iloc[0]) would be bound as BLOBs and match nothing."""
+    return value.item() if hasattr(value, "item") else value
+
+def lookup(db: StoreRef, table: str, column: str, value, columns: Optional[List[str]] = None) -> "pd.DataFrame":
+    """Rows of `table` where `column` equals value. Table and column names are validated."""
+    import pandas as pd
+    _check_table(table)
+    conn, owned = _connect(db)
+    try:
+        known = [r[1] for r in conn.execute(f'PRAGMA table_info("{table}")')]
+        if not known:
+            raise ValueError(f"table '{table}' is not loaded in the store")
+        wanted = columns or known
+        for col in [column, *wanted]:
+            if col not in known:
+                raise KeyError(f"table '{table}' has no column '{col}'")
+        select = ", ".join(f'"{c}"' for c in wanted)
+        return pd.read_sql_query(f'SELECT {select} FROM "{table}" WHERE "{column}" = ?', conn, params=[_param(value)])
+    finally:
+        if owned:
+            conn.close()
+
+def get_voyage(db: StoreRef, voyage_code: str, table: str = "record") -> "pd.DataFrame":
+    return lookup(db, table, "voyage_code", voyage_code)
+
+def get_person(db: StoreRef, person_id, table: str = "person") -> "pd.DataFrame":
+    return lookup(db, table, "person_id", person_id)
+
+def get_ship(db: StoreRef, ship_id, table: str = "ship") -> "pd.DataFrame":
+    return lookup(db, table, "ship_id", ship_id)
+
+def get_place(db: StoreRef, place: str, table: str = "place", column: str = "place_name") -> "pd.DataFrame":
+    return lookup(db, table, column, place)
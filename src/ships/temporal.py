@@ -0,0 +1,145 @@
+"""
+Typed date columns and "who was aboard when" queries.
+- parse dd/mm/yyyy text once (per unique value) into datetime64 columns
+- days_on_voyage in one vectorized pass
+- AboardIndex: per ship / voyage interval tree over embark-disembark periods
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%d/%m/%Y"
+
+def parse_dates(values: pd.Series, fmt: Optional[str] = DATE_FORMAT) -> pd.Series:
+    """
+    Parse a column of date strings to datetime64. Each distinct string is parsed
+    once with the fixed format (registers repeat the same dates many times);
+    unparseable values become NaT. fmt=None lets pandas infer the format.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(pd.Index(uniques, dtype=object), format=fmt, errors="coerce")
+    # code -1 (missing) takes the appended NaT
+    out = parsed.append(pd.DatetimeIndex([pd.NaT])).take(codes)
+    return pd.Series(out, index=values.index, name=values.name)
+
+def add_typed_dates(df: pd.DataFrame, columns: Iterable[str] = ("Emb_date", "Disemb_date"),
+                    fmt: Optional[str] = DATE_FORMAT) -> pd.DataFrame:
+    """Replace the given text date columns (those present) with datetime64 columns."""
+    for col in columns:
+        if col in df.columns:
+            df[col] = parse_dates(df[col], fmt=fmt)
+    return df
+
+def days_on_voyage(df: pd.DataFrame, start_col: str = "Emb_date", end_col: str = "Disemb_date") -> pd.Series:
+    """Whole days between embark and disembark (NA when either date is missing)."""
+    days = (parse_dates(df[end_col]) - parse_dates(df[start_col])).dt.days
+    return days.astype("Int64").rename("days_on_voyage")
+
+
+class _IntervalTree:
+    """
+    Static centered interval tree over integer [start, end] intervals (inclusive).
+    Stabbing queries cost O(log n + k) for k results.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        self.starts = starts
+        self.ends = ends
+        self.root = self._build(np.arange(len(starts)))
+
+    def _build(self, ids):
+        if len(ids) == 0:
+            return None
+        s, e = self.starts[ids], self.ends[ids]
+        center = np.median(np.concatenate([s, e]))
+        left, right = ids[e < center], ids[s > center]
+        here = ids[(s <= center) & (e >= center)]
+        by_start = here[np.argsort(self.starts[here], kind="stable")]
+        by_end = here[np.argsort(-self.ends[here], kind="stable")]
+        return (center, by_start, self.starts[by_start], by_end, -self.ends[by_end],
+                self._build(left), self._build(right))
+
+    def stab(self, x) -> np.ndarray:
+        found = []
+        node = self.root
+        while node is not None:
+            center, by_start, starts, by_end, neg_ends, left, right = node
+            if x < center:
+                found.append(by_start[:np.searchsorted(starts, x, side="right")])
+                node = left
+            elif x > center:
+                found.append(by_end[:np.searchsorted(neg_ends, -x, side="right")])
+                node = right
+            else:
+                found.append(by_start)
+                break
+        return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+class AboardIndex:
+    """
+    Index embark/disembark periods per group (ship, voyage...) to answer
+    "who was aboard ship X on date D" and period-overlap queries in logarithmic time.
+
+    Dates may be text (dd/mm/yyyy) or datetime64. Rows without an embark date are
+    left out; rows without a disembark date are left out too unless open_ended=True,
+    in which case they count as aboard from embarkation onwards.
+    """
+
+    def __init__(self, df: pd.DataFrame, group_col: Optional[str] = "ship_id",
+                 start_col: str = "Emb_date", end_col: str = "Disemb_date", open_ended: bool = False):
+        self.df = df
+        starts = parse_dates(df[start_col]).to_numpy()
+        ends = parse_dates(df[end_col]).to_numpy()
+        # keep the parsed resolution (register dates before 1677 do not fit in ns);
+        # if the columns differ, use the coarser one
+        self._unit = max((np.datetime_data(a.dtype)[0] for a in (starts, ends)),
+                         key=lambda u: np.timedelta64(1, u).astype("timedelta64[ns]"))
+        starts = starts.astype(f"datetime64[{self._unit}]").view("i8")
+        ends = ends.astype(f"datetime64[{self._unit}]").view("i8")
+        nat = np.iinfo(np.int64).min
+        if open_ended:
+            ends = np.where(ends == nat, np.iinfo(np.int64).max, ends)
+        valid = (starts != nat) & (ends != nat) & (ends >= starts)
+        groups = df[group_col].to_numpy() if group_col is not None else np.zeros(len(df), dtype=np.int8)
+
+        self._trees: Dict = {}
+        rows = np.flatnonzero(valid)
+        codes, uniques = pd.factorize(groups[rows])
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        for g, key in enumerate(uniques):
+            pos = rows[order[bounds[g]:bounds[g + 1]]]
+            pos = pos[np.argsort(starts[pos], kind="stable")]
+            self._trees[key] = (pos, starts[pos], _IntervalTree(starts[pos], ends[pos]))
+
+    def _ts(self, date) -> int:
+        if isinstance(date, str):
+            date = pd.to_datetime(date, format=DATE_FORMAT)
+        return int(np.datetime64(pd.Timestamp(date).to_datetime64(), self._unit).view("i8"))
+
+    def _rows(self, positions: np.ndarray) -> pd.DataFrame:
+        return self.df.iloc[np.sort(positions)]
+
+    def aboard(self, group, date) -> pd.DataFrame:
+        """Rows of `group` whose period contains date (embark <= date <= disembark)."""
+        entry = self._trees.get(group)
+        if entry is None:
+            return self.df.iloc[:0]
+        pos, _, tree = entry
+        return self._rows(pos[tree.stab(self._ts(date))])
+
+    def overlapping(self, group, start, end) -> pd.DataFrame:
+        """Rows of `group` whose period overlaps [start, end]."""
+        entry = self._trees.get(group)
+        if entry is None:
+            return self.df.iloc[:0]
+        pos, starts, tree = entry
+        a, b = self._ts(start), self._ts(end)
+        # periods covering `a`, plus periods starting inside (a, b]
+        later = np.arange(np.searchsorted(starts, a, side="right"), np.searchsorted(starts, b, side="right"))
+        return self._rows(pos[np.concatenate([tree.stab(a), later])])
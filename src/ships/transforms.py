@@ -3,29 +3,78 @@
 - extracting structured details from free-text remarks
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, List, Optional, Union
 
-def explode_slash_indices(df: pd.DataFrame, column: str, new_column: str = None) -> pd.DataFrame:
+_MISSING = "\x00"  # stands in for a missing / empty cell while splitting
+
+def _split_parts(values: pd.Series):
+    """Return (parts per row, flat array of stripped non-empty parts) for a slash column."""
+    # collapse separators (and the blanks around them) so the split yields no empty parts
+    text = values.astype(str).where(values.notna())
+    text = text.str.replace(r"\s*/[\s/]*", "/", regex=True).str.strip().str.strip("/").str.strip()
+    missing = (text.isna() | (text == "")).to_numpy()
+    text = text.where(~missing, _MISSING).tolist()
+    counts = np.fromiter((t.count("/") + 1 for t in text), dtype=np.int64, count=len(text))
+    if not text:  # "".split("/") would still yield one part
+        return counts, np.empty(0, dtype=object)
+    # one C-level split of the joined column instead of a Python list per row
+    flat = np.array("/".join(text).split("/"), dtype=object)
+    flat[(np.cumsum(counts) - counts)[missing]] = np.nan  # a missing row is a single part
+    return counts, flat
+
+def explode_slash_indices(df: pd.DataFrame, column: Union[str, List[str]], new_column: str = None,
+                          row_key: Optional[str] = None) -> pd.DataFrame:
     """
     If a column contains slash-separated values (e.g. 'A/B/C'),
     explode to multiple rows, preserving other columns.
+
+    column may be a list of aligned columns ('A/B' with '1/2' -> rows A,1 and B,2);
+    they are split together and must have the same number of parts on each row.
+    Parts are stripped and empty parts dropped; missing values stay missing.
+    The original index and the dtypes of the other columns are kept; row_key
+    additionally stores the source row position in a column, for regrouping.
     """
-    new_column = new_column or column
-    df = df.copy()
-    # split into lists
-    df['_split_list'] = df[column].astype(str).apply(lambda s: [x.strip() for x in s.split('/') if x.strip()])
-    df = df.explode('_split_list')
-    df[new_column] = df['_split_list']
-    df = df.drop(columns=['_split_list'])
-    return df
-
-def extract_from_remarks(remarks: pd.Series, patterns: Dict[str, str]) -> pd.DataFrame:
+    columns = [column] if isinstance(column, str) else list(column)
+    if new_column is not None and len(columns) > 1:
+        raise ValueError("new_column can only be used with a single column")
+    targets = [new_column] if new_column else columns
+
+    counts, parts = None, {}
+    for col, target in zip(columns, targets):
+        n, parts[target] = _split_parts(df[col])
+        if counts is None:
+            counts = n
+        elif (n != counts).any():
+            bad = np.flatnonzero(n != counts)
+            raise ValueError(f"slash-separated columns {columns} have different part counts "
+                             f"on {len(bad)} rows (first at index {df.index[bad[0]]!r})")
+
+    positions = np.repeat(np.arange(len(df)), counts)
+    out = df.take(positions)
+    for target, flat in parts.items():
+        out[target] = flat
+    if row_key is not None:
+        out[row_key] = positions
+    return out
+
+def extract_from_remarks(remarks: pd.Series, patterns: Dict[str, str], flags: int = 0) -> pd.DataFrame:
     """
     Given a series of free-text remarks and patterns dict of {field: regex},
     return dataframe of extracted fields (NaN when not matched).
+
+    Remarks are factorized first, so every pattern runs once per distinct
+    remark rather than once per row (registers repeat the same remark a lot).
     """
-    out = {}
-    for name, pat in patterns.items():
-        out[name] = remarks.str.extract(pat, expand=False)
-    return pd.DataFrame(out)
+    codes, uniques = pd.factorize(remarks)
+    if len(uniques) == len(remarks):
+        return pd.DataFrame({name: remarks.str.extract(pat, flags=flags, expand=False)
+                             for name, pat in patterns.items()}, index=remarks.index)
+    distinct = pd.Series(uniques, dtype=remarks.dtype)
+    out = pd.DataFrame({name: distinct.str.extract(pat, flags=flags, expand=False)
+                        for name, pat in patterns.items()}, index=distinct.index)
+    # code -1 (missing remark) is not in the index, so reindex leaves those rows NaN
+    out = out.reindex(codes)
+    out.index = remarks.index
+    return out
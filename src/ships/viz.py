@@ -3,9 +3,21 @@ Visualization helpers for routes and graphs.
 Uses matplotlib for portability and compatibility.
 """
 
-import matplotlib.pyplot as plt
+try:
+    import matplotlib.pyplot as plt
+except ImportError as e:  # optional dependency (`viz` extra)
+    raise ImportError("ships.viz requires matplotlib: pip install 'ships_project[viz]'") from e
+from matplotlib.collections import LineCollection
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
 import networkx as nx
-from typing import Any, List
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
 
 def plot_route_map(coords: List[tuple], title: str = "Route", ax: Any = None):
     if ax is None:
@@ -28,13 +40,106 @@ def plot_route_map(coords: List[tuple], title: str = "Route", ax: Any = None):
     ax.set_title(title)
     return fig, ax
 
-def plot_routes_graph(G, top_n=50, figsize=(10,8)):
-    plt.figure(figsize=figsize)
-    # create a subgraph of top edges by weight
-    edges = sorted(G.edges(data=True), key=lambda e: e[2].get('count',1), reverse=True)[:top_n]
-    H = nx.DiGraph()
-    for u,v,d in edges:
-        H.add_edge(u,v,weight=d.get('count',1))
-    pos = nx.spring_layout(H, seed=42)
-    weights = [H[u][v]['weight'] for u,v in H.edges()]
-    nx.draw(H, pos, with_labels=True, node_size=300, arrowsize=15, width=[max(0.5, w/5) for w in weights])
\ No newline at end of file
+# spring layouts are cached here by graph fingerprint; override with SHIPS_CACHE_DIR
+LAYOUT_CACHE_DIR = Path(os.environ.get("SHIPS_CACHE_DIR", Path.home() / ".cache" / "ships")) / "layouts"
+_layout_memo: Dict[str, Dict] = {}
+
+def top_edges(G, top_n: int = 50, weight: str = 'count'):
+    """
+    The top_n heaviest edges of G as (u, v, w) tuples, heaviest first.
+    Uses a partial sort (argpartition), so only the selected edges get sorted.
+    """
+    edges = list(G.edges(data=weight, default=1))
+    if not edges:
+        return []
+    w = np.fromiter((e[2] for e in edges), dtype=float, count=len(edges))
+    if top_n < len(edges):
+        idx = np.argpartition(-w, top_n - 1)[:top_n]
+    else:
+        idx = np.arange(len(edges))
+    idx = idx[np.argsort(-w[idx], kind="stable")]
+    return [edges[i] for i in idx]
+
+def graph_fingerprint(edges, **params) -> str:
+    """Stable hash of an edge list plus layout parameters, used as the layout cache key."""
+    h = hashlib.sha1()
+    for u, v, w in sorted(edges, key=lambda e: (repr(e[0]), repr(e[1]))):
+        h.update(f"{u!r}\x1f{v!r}\x1f{w!r}\x1e".encode())
+    h.update(repr(sorted(params.items())).encode())
+    return h.hexdigest()
+
+def spring_layout_cached(edges, seed: int = 42, cache_dir=LAYOUT_CACHE_DIR) -> Dict:
+    """
+    nx.spring_layout of the graph made of (u, v, weight) edges, computed once per
+    fingerprint: kept in memory and, unless cache_dir is None, pickled to disk.
+    """
+    key = graph_fingerprint(edges, layout="spring", seed=seed)
+    if key in _layout_memo:
+        return _layout_memo[key]
+    path = Path(cache_dir) / f"{key}.pkl" if cache_dir is not None else None
+    if path is not None and path.exists():
+        with open(path, 'rb') as f:
+            pos = pickle.load(f)
+    else:
+        H = nx.DiGraph()
+        H.add_weighted_edges_from(edges)
+        pos = {n: tuple(float(c) for c in xy) for n, xy in nx.spring_layout(H, seed=seed).items()}
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(pos, f)
+    _layout_memo[key] = pos
+    return pos
+
+def plot_routes_graph(G, top_n=50, figsize=(10,8), layout: str = 'spring', coords: Optional[Dict] = None,
+                      with_labels: bool = True, cache_dir=LAYOUT_CACHE_DIR, weight: str = 'count',
+                      max_width: float = 6.0, ax: Any = None):
+    """
+    Draw the top_n heaviest routes of G. Edges are one LineCollection (width by
+    weight, scaled down so none exceeds max_width) with direction marks from a
+    single quiver, so thousands of edges stay fast.
+    layout='spring' uses a cached spring layout; layout='geo' places ports at
+    coords[place] = (lat, lon), dropping edges whose ports have no coordinates.
+    """
+    edges = top_edges(G, top_n, weight=weight)
+    if layout == 'geo':
+        if coords is None:
+            raise ValueError("layout='geo' needs coords {place: (lat, lon)}")
+        missing = {n for u, v, _ in edges for n in (u, v) if n not in coords}
+        if missing:
+            logger.warning("No coordinates for %d places, their routes are not drawn: %s", len(missing), sorted(map(str, missing))[:10])
+            edges = [e for e in edges if e[0] not in missing and e[1] not in missing]
+        pos = {n: (float(coords[n][1]), float(coords[n][0])) for u, v, _ in edges for n in (u, v)}
+    elif layout == 'spring':
+        pos = spring_layout_cached(edges, cache_dir=cache_dir)
+    else:
+        raise ValueError(f"unknown layout '{layout}', expected 'spring' or 'geo'")
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = None
+    if not edges:
+        return fig, ax
+    nodes = list(pos)
+    xy = np.array([pos[n] for n in nodes])
+    seg = np.array([(pos[u], pos[v]) for u, v, _ in edges])
+    widths = np.maximum(0.5, np.array([e[2] for e in edges], dtype=float) / 5)
+    widths *= min(1.0, max_width / widths.max())
+    ax.add_collection(LineCollection(seg, linewidths=widths, colors='k', alpha=0.6, zorder=1))
+    # short arrow just past each edge midpoint shows direction
+    d = seg[:, 1] - seg[:, 0]
+    mid = seg[:, 0] + 0.55 * d
+    ax.quiver(mid[:, 0], mid[:, 1], 0.05 * d[:, 0], 0.05 * d[:, 1], angles='xy', scale_units='xy', scale=1,
+              width=0.003, headwidth=6, headlength=6, color='k', zorder=2)
+    ax.scatter(xy[:, 0], xy[:, 1], s=60, zorder=3)
+    if with_labels:
+        for n, (x, y) in zip(nodes, xy):
+            ax.text(x, y, str(n), fontsize=8, ha='center', va='bottom', zorder=4)
+    ax.autoscale_view()
+    if layout == 'geo':
+        ax.set_xlabel('Longitude')
+        ax.set_ylabel('Latitude')
+    else:
+        ax.set_axis_off()
+    return fig, ax
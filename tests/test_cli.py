@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+from ships.cli import main
+
+def test_legacy_invocation_streams_to_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    src = tmp_path / "in.csv"
+    pd.DataFrame({"place": [" St. Johns ", "Brest"], "voyage_id": ["a/b", "c"]}).to_csv(src, index=False)
+    out = tmp_path / "out.parquet"
+    main(["-i", str(src), "-o", str(out), "--clean-places", "--fix-voyage-ids", "--batch-rows", "1"])
+    df = pd.read_parquet(out)
+    assert df["place"].tolist() == ["St Johns", "Brest"]
+    assert df["voyage_id"].tolist() == ["a-b", "c"]
+
+def test_clean_streams_column_empty_in_first_chunk(tmp_path):
+    pytest.importorskip("pyarrow")
+    src = tmp_path / "in.csv"
+    src.write_text("place,n\n,1\n,2\n,3\nBrest,\n")
+    out = tmp_path / "out.parquet"
+    main(["-i", str(src), "-o", str(out), "--batch-rows", "2"])
+    df = pd.read_parquet(out)
+    assert df["place"].tolist()[3] == "Brest" and df["place"].isna().sum() == 3
+    assert df["n"].tolist()[:3] == [1.0, 2.0, 3.0] and pd.isna(df["n"].iloc[3])
+
+def test_workers_only_on_loading_commands(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["pipeline", "-i", "x.csv", "-o", "y.csv", "--workers", "2"])
+
+def test_validate_exits_nonzero_on_problems(tmp_path):
+    src = tmp_path / "in.csv"
+    pd.DataFrame({"voyage_id": ["a", "a"]}).to_csv(src, index=False)
+    with pytest.raises(SystemExit) as exc:
+        main(["validate", "-i", str(src), "--unique", "voyage_id"])
+    assert exc.value.code == 1
+
+def test_routes_writes_edge_list(tmp_path):
+    src = tmp_path / "legs.csv"
+    pd.DataFrame({"from_place": ["A", "A", "B"], "to_place": ["B", "B", "C"]}).to_csv(src, index=False)
+    out = tmp_path / "edges.csv"
+    main(["routes", "-i", str(src), "-o", str(out)])
+    edges = pd.read_csv(out)
+    assert edges.iloc[0].tolist() == ["A", "B", 2]
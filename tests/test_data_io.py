@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from ships.data_io import infer_csv_dtypes, iter_csv_batches, load_csvs, write_parquet_batches, iter_frame_batches
+
+def test_load_csvs_keeps_order(tmp_path):
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"t{i}.csv"
+        pd.DataFrame({"x": [i, i]}).to_csv(p, index=False)
+        paths.append(p)
+    dfs = load_csvs(paths, max_workers=3)
+    assert [int(d["x"].iloc[0]) for d in dfs] == [0, 1, 2]
+
+def test_write_parquet_batches_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = pd.DataFrame({"voyage_code": ["V1", "V2", "V1", "V3", "V2"], "place": [None, None, "Brest", "Lorient", None]})
+    out = tmp_path / "out.parquet"
+    assert write_parquet_batches(iter_frame_batches(df, batch_rows=2), out) == 5
+    assert pq.ParquetFile(out).metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(out), df, check_dtype=False)
+
+def test_write_parquet_batches_partitioned(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = pd.DataFrame({"voyage_code": ["V1", "V2", "V1", "V3", "V1"], "n": [1, 2, 3, 4, 5]})
+    out = tmp_path / "ds"
+    assert write_parquet_batches(iter_frame_batches(df, batch_rows=2), out, partition_col="voyage_code") == 5
+    assert sorted(p.name for p in out.iterdir()) == ["voyage_code=V1", "voyage_code=V2", "voyage_code=V3"]
+    # one file per partition, one row group per batch that had rows for it
+    files = list((out / "voyage_code=V1").iterdir())
+    assert len(files) == 1 and pq.ParquetFile(files[0]).metadata.num_row_groups == 3
+    assert sorted(pd.read_parquet(out)["n"]) == [1, 2, 3, 4, 5]
+    with pytest.raises(FileExistsError):
+        write_parquet_batches(iter_frame_batches(df), out, partition_col="voyage_code")
+
+def test_write_parquet_batches_honours_schema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"n": [1, 2, 3]})
+    out = tmp_path / "out.parquet"
+    write_parquet_batches(iter_frame_batches(df, batch_rows=2), out, schema=pa.schema([("n", pa.float64())]))
+    assert pd.read_parquet(out)["n"].dtype == "float64"
+
+def test_infer_csv_dtypes_covers_all_chunks(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text("place,n,flag\n,1,True\n,2,False\nBrest,,True\n")
+    assert infer_csv_dtypes(src, batch_rows=2) == {"place": "str", "n": "float64", "flag": "bool"}
+
+def test_load_csvs_matches_streamed_dtypes(tmp_path):
+    pytest.importorskip("pyarrow")
+    src = tmp_path / "in.csv"
+    src.write_text("voyage_id,date,at,place,n,flag\n1,2020-01-01,2020-01-01T10:00,Brest,1,True\n"
+                   "2,,2020-01-02T10:00,,,\n3,2020-03-01,,Lorient,3,False\n")
+    loaded = load_csvs([src])[0]
+    streamed = pd.concat(iter_csv_batches(src, batch_rows=2, dtype=infer_csv_dtypes(src, batch_rows=2)))
+    assert loaded["date"].tolist()[0] == "2020-01-01" and loaded["at"].iloc[0] == "2020-01-01T10:00"
+    pd.testing.assert_frame_equal(loaded.drop(columns="flag"), streamed.drop(columns="flag").reset_index(drop=True))
+    # both end up with the same parquet schema (the bool column is object vs "boolean" in memory)
+    pa = pytest.importorskip("pyarrow")
+    types = lambda df: [f.type for f in pa.Schema.from_pandas(df, preserve_index=False)]
+    assert types(loaded) == types(streamed)
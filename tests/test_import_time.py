@@ -0,0 +1,39 @@
+"""
+Cold-start budgets: each check imports a module in a fresh interpreter.
+Scale the time budgets on slow machines with SHIPS_IMPORT_BUDGET_SCALE.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import ships
+
+HEAVY = ("pandas", "matplotlib", "networkx", "geopandas", "shapely", "scgraph")
+SCALE = float(os.environ.get("SHIPS_IMPORT_BUDGET_SCALE", "1"))
+
+def _cold_import(module):
+    code = (
+        "import sys, time, json\n"
+        f"sys.path.insert(0, {str(Path(ships.__file__).parents[1])!r})\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "t = time.perf_counter() - t\n"
+        f"print(json.dumps([t, [m for m in {HEAVY!r} if m in sys.modules]]))\n"
+    )
+    # best of three runs, so a cold disk cache does not fail the budget
+    runs = [json.loads(subprocess.run([sys.executable, "-c", code], check=True,
+                                      capture_output=True, text=True).stdout) for _ in range(3)]
+    return min(r[0] for r in runs), runs[0][1]
+
+@pytest.mark.parametrize("module,budget,allowed", [
+    ("ships", 0.2, ()),
+    ("ships.cli", 0.5, ()),
+    ("ships.extractor", 0.5, ()),
+])
+def test_import_budget(module, budget, allowed):
+    seconds, loaded = _cold_import(module)
+    assert set(loaded) <= set(allowed), f"{module} pulled in {loaded}"
+    assert seconds <= budget * SCALE, f"import {module} took {seconds:.3f}s (budget {budget * SCALE:.2f}s)"
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+from ships.joins import Dimension, join_star_schema
+
+def test_join_star_schema_many_to_one():
+    record = pd.DataFrame({"person_id": [10, 11, 10, 99], "voyage_code": ["V1", "V1", "V2", None]})
+    person = pd.DataFrame({"person_id": ["10", "11"], "name": ["Jean", "Pierre"]})
+    voyage = pd.DataFrame({"voyage_code": ["V1", "V2"], "ship_id": [1, 2], "year": [1750, 1751]})
+    out = join_star_schema(record, {"person": Dimension(person, "person_id"),
+                                    "voyage": Dimension(voyage, "voyage_code", columns=["ship_id"])})
+    assert len(out) == len(record)
+    assert list(out["name"].iloc[:3]) == ["Jean", "Pierre", "Jean"]
+    assert pd.isna(out.loc[3, "name"]) and pd.isna(out.loc[3, "ship_id"])
+    assert "year" not in out.columns
+
+def test_join_star_schema_detects_row_explosion():
+    record = pd.DataFrame({"voyage_code": ["V1", "V1"]})
+    voyage = pd.DataFrame({"voyage_code": ["V1", "V1"], "ship_id": [1, 2]})
+    with pytest.raises(ValueError):
+        join_star_schema(record, {"voyage": Dimension(voyage, "voyage_code")})
+    assert len(join_star_schema(record, {"voyage": Dimension(voyage, "voyage_code")}, max_fanout=2)) == 4
+
+def test_join_star_schema_two_fanout_dimensions():
+    record = pd.DataFrame({"person_id": [1, 2], "voyage_code": ["V1", "V2"]})
+    person = pd.DataFrame({"person_id": [1, 1], "alias": ["Jean", "Jehan"]})
+    voyage = pd.DataFrame({"voyage_code": ["V1", "V1", "V2"], "port": ["Brest", "Lorient", "Nantes"]})
+    dims = {"person": Dimension(person, "person_id"), "voyage": Dimension(voyage, "voyage_code")}
+    # 2x2 rows for the first record, 1 for the second: 5 rows, more than either dimension alone
+    with pytest.raises(ValueError):
+        join_star_schema(record, dims, max_fanout=2)
+    out = join_star_schema(record, dims, max_fanout=3)
+    assert len(out) == 5
+    assert sorted(zip(out["alias"].fillna(""), out["port"]))[:2] == [("", "Nantes"), ("Jean", "Brest")]
+    assert not any(c.startswith("__key") for c in out.columns)
+
+def test_join_star_schema_float_keys_with_gaps_match_text_keys():
+    record = pd.DataFrame({"person_id": [1.0, 2.0, None]})
+    person = pd.DataFrame({"person_id": ["1", "2"], "name": ["Jean", "Pierre"]})
+    out = join_star_schema(record, {"person": Dimension(person, "person_id")})
+    assert out["name"].tolist()[:2] == ["Jean", "Pierre"] and pd.isna(out["name"].iloc[2])
+
+def test_join_star_schema_fanout_keeps_fact_index():
+    record = pd.DataFrame({"voyage_code": ["V1", "V2", "V3"]}, index=pd.CategoricalIndex([10, 11, 12], name="rid"))
+    voyage = pd.DataFrame({"voyage_code": ["V1", "V1", "V2", "V3", "V3"], "port": list("abcde")})
+    out = join_star_schema(record, {"voyage": Dimension(voyage, "voyage_code")}, max_fanout=2)
+    assert out.index.tolist() == [10, 10, 11, 12, 12] and out.index.name == "rid"
@@ -0,0 +1,22 @@
+import pandas as pd
+from ships.pipeline import expand_stage, extract_stage
+
+def test_extract_stage_days_on_voyage():
+    df = pd.DataFrame({"Remarks": ["embarqué à Brest le 12/03/1750, débarqué à Lorient le 04/11/1751",
+                                   "embarqué à Brest le 12/03/1750"]})
+    out = extract_stage(df)
+    assert out["Emb_date"].tolist()[0] == pd.Timestamp("1750-03-12")
+    assert out["Disemb_date"].iloc[0] == pd.Timestamp("1751-11-04") and pd.isna(out["Disemb_date"].iloc[1])
+    assert out["days_on_voyage"].tolist() == [602, pd.NA]
+
+def test_expand_stage_orders_legs_by_date():
+    person = {"Last Name": "Le Gall", "First Name": "Yves", "Function": "matelot"}
+    df = pd.DataFrame([
+        {**person, "Remarks": "embarqué à Brest le 01/11/1751, débarqué à Lorient le 04/12/1751"},
+        {**person, "Remarks": "embarqué à Nantes le 12/03/1750, débarqué à Cadix le 04/05/1750"},
+        {**person, "Remarks": "rembarqué"},
+    ])
+    out = expand_stage(df)
+    # as text, 12/03/1750 would sort after 01/11/1751 and the rembarqué leg would start from Cadix
+    assert out["Emb_date"].tolist()[:2] == [pd.Timestamp("1750-03-12"), pd.Timestamp("1751-11-01")]
+    assert out["Emb_loc"].tolist() == ["Nantes", "Brest", "Lorient"]
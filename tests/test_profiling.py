@@ -0,0 +1,31 @@
+import pandas as pd
+from ships import profiling
+from ships.extractor import extract_details
+from ships.pipeline import run_pipeline
+
+def test_profiling_disabled_records_nothing():
+    profiling.reset()
+    extract_details("embarqué à Lorient le 12/03/1750, débarqué à Brest le 04/11/1751")
+    with profiling.stage("noop"):
+        pass
+    assert profiling.report() == {"stages": [], "counters": {}}
+
+def test_run_pipeline_stage_report(tmp_path):
+    src = tmp_path / "crew.csv"
+    pd.DataFrame({
+        "Last Name": ["Martin", "Guillou"], "First Name": ["Jean", "Yves"], "Function": ["matelot", "mousse"],
+        "Remarks": ["embarqué à Lorient le 12/03/1750, débarqué à Brest le 04/11/1751",
+                    "embarqué à Lorient le 01/02/1752, déserté à Cadix le 03/04/1752"],
+        "Emb_loc": [None, None], "Disemb_loc": [None, None],
+    }).to_csv(src, index=False)
+    profiling.enable()
+    try:
+        run_pipeline(src, None, tmp_path / "out.csv")
+        report = profiling.report()
+    finally:
+        profiling.disable()
+    names = [s["name"] for s in report["stages"]]
+    assert names == ["read", "cleaning", "expansion", "extraction", "classification", "write"]
+    assert all(s["peak_mb"] is not None for s in report["stages"])
+    assert report["stages"][1]["rows_in"] == 2
+    assert report["counters"]["extractor.embark.embarqué.date"]["hits"] >= 2
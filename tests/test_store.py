@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ships.store import build_store, get_voyage, get_person, list_tables, query
+
+def test_build_store_and_lookup(tmp_path):
+    db = tmp_path / "ships.sqlite"
+    record = pd.DataFrame({"voyage_code": ["V1", "V1", "V2"], "person_id": [1, 2, 1]})
+    person = pd.DataFrame({"person_id": [1, 2], "name": ["Jean", "Pierre"]})
+    build_store(db, {"record": record, "person": person})
+    assert list_tables(db) == ["person", "record"]
+    assert len(get_voyage(db, "V1")) == 2
+    assert get_person(db, 2)["name"].tolist() == ["Pierre"]
+    indexes = query(db, "SELECT name FROM sqlite_master WHERE type = 'index'")["name"].tolist()
+    assert sorted(indexes) == ["ix_person_person_id", "ix_record_person_id", "ix_record_voyage_code"]
+
+def test_build_store_refresh_keeps_other_tables(tmp_path):
+    db = tmp_path / "ships.sqlite"
+    build_store(db, {"ship": pd.DataFrame({"ship_id": [1], "name": ["Hercule"]})})
+    build_store(db, {"record": pd.DataFrame({"voyage_code": ["V1"], "ship_id": [1]})})
+    assert list_tables(db) == ["record", "ship"]
+
+def test_lookup_accepts_numpy_scalars(tmp_path):
+    db = tmp_path / "ships.sqlite"
+    person = pd.DataFrame({"person_id": [1, 2], "name": ["Jean", "Pierre"]})
+    build_store(db, {"person": person})
+    assert get_person(db, np.int64(2))["name"].tolist() == ["Pierre"]
+    assert get_person(db, person["person_id"].iloc[0])["name"].tolist() == ["Jean"]
+    assert query(db, "SELECT name FROM person WHERE person_id = ?", [np.int64(2)])["name"].tolist() == ["Pierre"]
+
+def test_build_store_failed_refresh_keeps_previous_store(tmp_path):
+    db = tmp_path / "ships.sqlite"
+    build_store(db, {"record": pd.DataFrame({"voyage_code": ["V1"]}),
+                     "ship": pd.DataFrame({"ship_id": [1], "name": ["Hercule"]})})
+    bad = pd.DataFrame({"person_id": [1], "name": [object()]})  # sqlite3 cannot bind this
+    with pytest.raises(Exception):
+        build_store(db, {"record": pd.DataFrame({"voyage_code": ["V2", "V3"]}), "person": bad})
+    assert list_tables(db) == ["record", "ship"]
+    assert get_voyage(db, "V1")["voyage_code"].tolist() == ["V1"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ships.sqlite"]
@@ -0,0 +1,29 @@
+import pandas as pd
+from ships.temporal import AboardIndex, days_on_voyage, parse_dates
+
+def test_parse_dates_and_days_on_voyage():
+    df = pd.DataFrame({"Emb_date": ["01/01/1750", "15/06/1750", None],
+                       "Disemb_date": ["01/03/1751", "bad", "01/01/1750"]})
+    parsed = parse_dates(df["Emb_date"])
+    assert parsed.iloc[1] == pd.Timestamp("1750-06-15") and pd.isna(parsed.iloc[2])
+    assert days_on_voyage(df).tolist() == [424, pd.NA, pd.NA]
+
+def test_aboard_index_queries():
+    df = pd.DataFrame({
+        "ship_id": [1, 1, 1, 2, 1],
+        "Emb_date": ["01/01/1750", "15/06/1750", "01/02/1751", "01/01/1750", "01/06/1752"],
+        "Disemb_date": ["01/03/1751", "20/06/1750", None, "01/01/1752", "01/07/1752"],
+    })
+    ix = AboardIndex(df, group_col="ship_id")
+    assert ix.aboard(1, "16/06/1750").index.tolist() == [0, 1]
+    assert ix.aboard(1, pd.Timestamp("1751-02-15")).index.tolist() == [0]
+    assert ix.aboard(3, "01/01/1750").empty
+    assert ix.overlapping(1, "21/06/1750", "15/06/1752").index.tolist() == [0, 4]
+    assert AboardIndex(df, open_ended=True).aboard(1, "01/01/1760").index.tolist() == [2]
+
+def test_aboard_index_dates_before_1677():
+    df = pd.DataFrame({"ship_id": [1, 1], "Emb_date": ["01/01/1665", "01/06/1666"],
+                       "Disemb_date": ["01/03/1666", "01/01/1667"]})
+    ix = AboardIndex(df)
+    assert ix.aboard(1, "15/02/1665").index.tolist() == [0]
+    assert ix.overlapping(1, "01/02/1666", "01/07/1666").index.tolist() == [0, 1]
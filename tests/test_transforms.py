@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+from ships.transforms import explode_slash_indices, extract_from_remarks
+
+def test_explode_slash_indices_aligned_columns():
+    df = pd.DataFrame({"voyage_id": ["A/B", " C ", "D//E/", None], "leg": ["1/2", "3", "4 / 5", None], "n": [1, 2, 3, 4]})
+    out = explode_slash_indices(df, ["voyage_id", "leg"], row_key="row")
+    assert out["voyage_id"].tolist()[:5] == ["A", "B", "C", "D", "E"]
+    assert out["leg"].tolist()[:5] == ["1", "2", "3", "4", "5"]
+    assert pd.isna(out["voyage_id"].iloc[5])
+    assert out["row"].tolist() == [0, 0, 1, 2, 2, 3]
+    assert out.index.tolist() == [0, 0, 1, 2, 2, 3]
+    assert out["n"].dtype == df["n"].dtype
+
+def test_explode_slash_indices_mismatched_counts():
+    with pytest.raises(ValueError):
+        explode_slash_indices(pd.DataFrame({"a": ["A/B"], "b": ["1"]}), ["a", "b"])
+
+def test_explode_slash_indices_empty_frame():
+    df = pd.DataFrame({"idx": pd.Series([], dtype=object), "name": pd.Series([], dtype=object)})
+    out = explode_slash_indices(df, "idx", row_key="row")
+    assert out.empty and list(out.columns) == ["idx", "name", "row"]
+
+def test_extract_from_remarks_repeated_remarks():
+    remarks = pd.Series(["embarqué à Lorient le 01/02/1750", None, "mort en mer", "embarqué à Lorient le 01/02/1750"])
+    out = extract_from_remarks(remarks, {"loc": r"embarqué à (\w+)", "date": r"le (\d{2}/\d{2}/\d{4})"})
+    assert out["loc"].tolist()[::3] == ["Lorient", "Lorient"]
+    assert out["date"].iloc[3] == "01/02/1750"
+    assert out.iloc[1:3].isna().all().all()
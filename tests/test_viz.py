@@ -0,0 +1,36 @@
+import networkx as nx
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+from ships import viz  # noqa: E402
+
+def _graph():
+    G = nx.DiGraph()
+    for i, (a, b) in enumerate([("A", "B"), ("B", "C"), ("C", "A"), ("A", "D"), ("D", "B")]):
+        G.add_edge(a, b, count=i + 1)
+    return G
+
+def test_top_edges_partial_sort():
+    assert [(u, v) for u, v, _ in viz.top_edges(_graph(), top_n=2)] == [("D", "B"), ("A", "D")]
+    assert len(viz.top_edges(_graph(), top_n=50)) == 5
+
+def test_plot_routes_graph_caches_layout(tmp_path):
+    viz._layout_memo.clear()
+    fig, ax = viz.plot_routes_graph(_graph(), top_n=3, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    assert len(ax.collections[0].get_segments()) == 3
+    viz._layout_memo.clear()
+    edges = viz.top_edges(_graph(), top_n=3)
+    from_disk = viz.spring_layout_cached(edges, cache_dir=tmp_path)
+    viz._layout_memo.clear()
+    assert from_disk == viz.spring_layout_cached(edges, cache_dir=None)
+    matplotlib.pyplot.close(fig)
+
+def test_plot_routes_graph_geo_layout():
+    coords = {"A": (47.7, -3.4), "B": (48.4, -4.5), "C": (11.9, 79.8)}
+    fig, ax = viz.plot_routes_graph(_graph(), layout="geo", coords=coords, cache_dir=None)
+    segs = ax.collections[0].get_segments()
+    assert len(segs) == 3  # edges touching D have no coordinates
+    assert any(tuple(s[0]) == (-3.4, 47.7) for s in segs)
+    matplotlib.pyplot.close(fig)